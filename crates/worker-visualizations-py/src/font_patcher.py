@@ -84,6 +84,18 @@ EXTERNAL_RESOURCE_PATTERNS = [
     ),
 ]
 
+# Every pattern above matches a whole <link ...> tag or @import url(...) rule.
+# The HTML is scanned once for each kind of candidate and only the candidates
+# are checked against the patterns, instead of running every pattern over the
+# whole (multi-MB) document
+_CANDIDATE_RES = (
+    re.compile(r"<link[^>]*>", re.IGNORECASE),
+    re.compile(r"@import\s+url\([^)]*\);?", re.IGNORECASE),
+)
+
+_HEAD_TAG_RE = re.compile(r"<head[^>]*>", re.IGNORECASE)
+_URL_RE = re.compile(r'https?://[^\s"\'<>]+', re.IGNORECASE)
+
 
 def get_local_font_css() -> str:
     """
@@ -185,15 +197,35 @@ def patch_html_fonts(html_content: str) -> str:
         return html_content
 
     try:
-        removed_count = 0
-
-        # Remove all known external resource patterns
-        for pattern, description in EXTERNAL_RESOURCE_PATTERNS:
-            matches = pattern.findall(html_content)
-            if matches:
-                logger.debug(f"Removing {len(matches)} {description} reference(s)")
-                removed_count += len(matches)
-                html_content = pattern.sub("", html_content)
+        # Remove all known external resource patterns, counting removals per
+        # pattern (the first pattern that matches a candidate claims it)
+        removed_counts = [0] * len(EXTERNAL_RESOURCE_PATTERNS)
+
+        def remove_external(match: re.Match) -> str:
+            candidate = match.group()
+            for index, (pattern, _) in enumerate(EXTERNAL_RESOURCE_PATTERNS):
+                if pattern.fullmatch(candidate):
+                    removed_counts[index] += 1
+                    return ""
+            # No pattern covers the whole candidate (e.g. an unterminated
+            # "@import url(" running into a later rule): apply the patterns
+            # within it so nothing nested inside is missed
+            for index, (pattern, _) in enumerate(EXTERNAL_RESOURCE_PATTERNS):
+                candidate, count = pattern.subn("", candidate)
+                removed_counts[index] += count
+            return candidate
+
+        # Removing a reference can join the surrounding text into a new match,
+        # so repeat until a pass removes nothing (normally the second pass)
+        previous_total = -1
+        while sum(removed_counts) != previous_total:
+            previous_total = sum(removed_counts)
+            for candidate_re in _CANDIDATE_RES:
+                html_content = candidate_re.sub(remove_external, html_content)
+        for count, (_, description) in zip(removed_counts, EXTERNAL_RESOURCE_PATTERNS):
+            if count:
+                logger.debug(f"Removing {count} {description} reference(s)")
+        removed_count = sum(removed_counts)
 
         # Get local font CSS with embedded fonts
         local_font_css = get_local_font_css()
@@ -207,7 +239,7 @@ def patch_html_fonts(html_content: str) -> str:
 </style>"""
 
             # Insert our embedded font CSS in the <head> section
-            head_match = re.search(r"<head[^>]*>", html_content, re.IGNORECASE)
+            head_match = _HEAD_TAG_RE.search(html_content)
             if head_match:
                 insert_pos = head_match.end()
                 html_content = (
@@ -258,8 +290,7 @@ def verify_no_external_requests(html_content: str) -> list[str]:
     external_urls = []
 
     # Find all URLs in the HTML
-    url_pattern = re.compile(r'https?://[^\s"\'<>]+', re.IGNORECASE)
-    for match in url_pattern.finditer(html_content):
+    for match in _URL_RE.finditer(html_content):
         url = match.group()
         # Check if it's a font/resource URL that shouldn't be there
         if any(
@@ -11,13 +11,14 @@ import os
 import random
 import time
 from dataclasses import dataclass
-from typing import Any, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import httpx
+import orjson
 
 import cohere
 from cohere.types import UserChatMessageV2, TextAssistantMessageResponseContentItem
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 try:
     # Try relative imports (for package execution)
@@ -28,6 +29,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Cohere's SDK default request timeout, applied to the pool we hand it
+COHERE_TIMEOUT_SECS = 300.0
+
 
 @dataclass
 class InternalLLMResponse:
@@ -54,14 +58,115 @@ class InternalLLMResponse:
         return self.text.strip()
 
 
+def _parse_batch_topic_names(reply: str, count: int) -> List[Optional[str]]:
+    """Parse a batched naming reply ({"1": name, ...}) into a list of count names.
+
+    Models often wrap JSON in prose or a code fence, so the outermost {...} span
+    is parsed. Missing, blank, or non-string entries come back as None.
+    """
+    start = reply.find("{")
+    end = reply.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("Batch naming response contains no JSON object")
+    data = orjson.loads(reply[start : end + 1])
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected JSON object, got {type(data)}")
+
+    names: List[Optional[str]] = []
+    for number in range(1, count + 1):
+        name = data.get(str(number))
+        if isinstance(name, str) and name.strip():
+            names.append(name.strip())
+        else:
+            names.append(None)
+    return names
+
+
 class LLMProvider:
     """Flexible LLM provider interface with API key from config."""
 
     def __init__(self):
-        """Initialize LLM provider (clients created on-demand per request)."""
+        """Initialize LLM provider (clients created on demand and reused across jobs)."""
         self.request_count = 0
+        self.internal_api_url = os.environ.get(
+            "LLM_INFERENCE_API_URL", "http://localhost:8091"
+        )
+        # Shared keep-alive pool for the internal inference API, so topic naming
+        # requests reuse connections instead of reconnecting per cluster
+        self._http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=120.0,
+            ),
+        )
+        # Hosted provider clients memoized by (provider, api_key); LLMConfig itself
+        # is not hashable (its config field is a dict) and the model is chosen
+        # per request, so these two fields identify a reusable client
+        self._clients: Dict[
+            Tuple[str, str], Union[cohere.AsyncClientV2, AsyncOpenAI]
+        ] = {}
+        self._cohere_http_clients: List[httpx.AsyncClient] = []
         logger.info("LLM Provider initialized (clients will be created on-demand)")
 
+    def _get_cohere_client(self, llm_config: LLMConfig) -> cohere.AsyncClientV2:
+        """Return the cached Cohere client for this API key, creating it once."""
+        key = ("cohere", llm_config.api_key)
+        client = self._clients.get(key)
+        if client is None:
+            logger.debug(f"Creating Cohere client for model {llm_config.model}")
+            http_client = httpx.AsyncClient(timeout=COHERE_TIMEOUT_SECS)
+            self._cohere_http_clients.append(http_client)
+            client = cohere.AsyncClientV2(
+                api_key=llm_config.api_key, httpx_client=http_client
+            )
+            self._clients[key] = client
+        return cast(cohere.AsyncClientV2, client)
+
+    def _get_openai_client(self, llm_config: LLMConfig) -> AsyncOpenAI:
+        """Return the cached OpenAI client for this API key, creating it once."""
+        key = ("openai", llm_config.api_key)
+        client = self._clients.get(key)
+        if client is None:
+            logger.debug(f"Creating OpenAI client for model {llm_config.model}")
+            client = AsyncOpenAI(api_key=llm_config.api_key)
+            self._clients[key] = client
+        return cast(AsyncOpenAI, client)
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the internal inference API ahead of the first job.
+
+        Best effort: the internal API is only needed for the "internal" provider,
+        so an unreachable endpoint is logged and otherwise ignored.
+        """
+        warm_start = time.time()
+        try:
+            response = await self._http_client.get(
+                f"{self.internal_api_url}/health/live", timeout=5.0
+            )
+            warm_elapsed = time.time() - warm_start
+            logger.info(
+                f"Internal LLM API at {self.internal_api_url} responded "
+                f"{response.status_code} in {warm_elapsed:.3f}s"
+            )
+        except httpx.HTTPError as e:
+            logger.info(
+                f"Internal LLM API at {self.internal_api_url} not reachable during warm-up "
+                f"(only required for the internal provider): {type(e).__name__}: {e}"
+            )
+
+    async def close(self) -> None:
+        """Close pooled HTTP connections, including cached provider clients."""
+        for client in self._clients.values():
+            if isinstance(client, AsyncOpenAI):
+                await client.close()
+        for http_client in self._cohere_http_clients:
+            await http_client.aclose()
+        self._clients.clear()
+        self._cohere_http_clients.clear()
+        await self._http_client.aclose()
+
     async def generate_topic_name(
         self,
         texts: List[str],
@@ -92,10 +197,11 @@ class LLMProvider:
         temperature = llm_config.config.get("temperature", 0.3)
         samples_per_cluster = llm_config.config.get("samples_per_cluster", 5)
 
-        logger.debug(
-            f"LLM request #{self.request_count}: {llm_config.provider}/{llm_config.model} "
-            f"(texts: {len(texts)}, max_tokens: {max_tokens}, temperature: {temperature})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"LLM request #{self.request_count}: {llm_config.provider}/{llm_config.model} "
+                f"(texts: {len(texts)}, max_tokens: {max_tokens}, temperature: {temperature})"
+            )
 
         if not llm_config:
             logger.error("LLM config is missing")
@@ -151,6 +257,95 @@ class LLMProvider:
             )
             raise
 
+    async def generate_topic_names_batch(
+        self,
+        sample_lists: List[List[str]],
+        llm_config: LLMConfig,
+    ) -> List[Optional[str]]:
+        """
+        Generate topic names for several clusters with a single LLM request.
+
+        The sample texts of each cluster are numbered in one prompt and the model
+        is asked for a JSON object mapping cluster number to name, so a batch
+        costs one round-trip and one prompt preamble instead of one per cluster.
+
+        Args:
+            sample_lists: Sample texts for each cluster in the batch
+            llm_config: LLM configuration with provider, model, API key, and config params
+
+        Returns:
+            One topic name per entry of sample_lists, in order; None where the
+            response did not contain a usable name for that cluster
+
+        Raises:
+            Exception: If the LLM call fails or the response is not a JSON object
+        """
+        request_start = time.time()
+        self.request_count += 1
+
+        # Extract configuration with sensible defaults; max_tokens is the
+        # per-name budget, so the batch reply gets one budget per cluster
+        max_tokens = llm_config.config.get("max_tokens", 50) * len(sample_lists)
+        temperature = llm_config.config.get("temperature", 0.3)
+        samples_per_cluster = llm_config.config.get("samples_per_cluster", 5)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"LLM batch request #{self.request_count}: {llm_config.provider}/{llm_config.model} "
+                f"(clusters: {len(sample_lists)}, max_tokens: {max_tokens}, temperature: {temperature})"
+            )
+
+        # Validate API key for non-internal providers
+        provider = llm_config.provider.lower()
+        if provider != "internal" and not llm_config.api_key:
+            logger.error("API key is missing for non-internal provider")
+            raise ValueError("API key is missing for non-internal provider")
+
+        sections = []
+        for number, texts in enumerate(sample_lists, start=1):
+            samples_text = "\n".join(texts[:samples_per_cluster])
+            sections.append(f"Cluster {number} texts:\n{samples_text}")
+        prompt = (
+            f"These are representative texts from {len(sample_lists)} document clusters:\n\n"
+            + "\n\n".join(sections)
+            + "\n\nProvide a short, concise topic name (2-4 words) for each cluster that "
+            "captures its main theme. Respond with ONLY a JSON object mapping each "
+            'cluster number to its topic name, e.g. {"1": "name", "2": "name"}.'
+        )
+
+        try:
+            if provider == "cohere":
+                reply = await self._complete_cohere(
+                    prompt, llm_config, max_tokens, temperature
+                )
+            elif provider == "openai":
+                reply = await self._complete_openai(
+                    prompt, llm_config, max_tokens, temperature
+                )
+            elif provider == "internal":
+                reply = await self._complete_internal(
+                    prompt, llm_config, max_tokens, temperature
+                )
+            else:
+                logger.error(f"Unknown LLM provider: {llm_config.provider}")
+                raise ValueError(f"Unknown LLM provider: {llm_config.provider}")
+
+            names = _parse_batch_topic_names(reply, len(sample_lists))
+
+            elapsed = time.time() - request_start
+            logger.info(
+                f"LLM batch request #{self.request_count} completed in {elapsed:.3f}s: "
+                f"{sum(name is not None for name in names)}/{len(names)} clusters named"
+            )
+            return names
+        except Exception as e:
+            elapsed = time.time() - request_start
+            logger.error(
+                f"LLM batch request #{self.request_count} failed in {elapsed:.3f}s: {type(e).__name__}: {e}",
+                exc_info=True,
+            )
+            raise
+
     async def _generate_cohere(
         self,
         texts: List[str],
@@ -167,10 +362,6 @@ class LLMProvider:
         """
         cohere_start = time.time()
         try:
-            logger.debug(f"Initializing Cohere client for model {llm_config.model}")
-            client = cohere.ClientV2(api_key=llm_config.api_key)
-            logger.debug("Cohere client initialized")
-
             # Prepare sample texts for analysis
             sample_texts = texts[:samples_per_cluster]
             samples_text = "\n".join(sample_texts)
@@ -186,42 +377,14 @@ class LLMProvider:
                     f"Respond with ONLY the cluster name, no notes or explanation."
                 )
 
-            api_call_start = time.time()
-            logger.info(
-                f"Calling Cohere {llm_config.model} API (prompt length: {len(prompt)})"
-            )
-
-            # Call Cohere Chat API (v2 uses messages list format with proper types)
-            response = client.chat(
-                model=llm_config.model,
-                messages=[UserChatMessageV2(role="user", content=prompt)],
-                max_tokens=max_tokens,
-                temperature=temperature,
+            topic_name = await self._complete_cohere(
+                prompt, llm_config, max_tokens, temperature
             )
 
-            api_elapsed = time.time() - api_call_start
-            logger.info(f"Cohere API call completed in {api_elapsed:.3f}s")
-
-            # Extract text from response message
-            if not response.message.content:
-                logger.error("Cohere returned empty response content")
-                raise ValueError("Cohere returned empty response content")
-
-            # Get the text content from the first content item
-            content_list = response.message.content
-            if not content_list or len(content_list) == 0:
-                logger.error("Cohere returned empty content list")
-                raise ValueError("Cohere returned empty content list")
-
-            content_item = content_list[0]
-            # Cast to TextAssistantMessageResponseContentItem to access text attribute
-            text_item = cast(TextAssistantMessageResponseContentItem, content_item)
-            topic_name: str = text_item.text.strip()
-
             cohere_elapsed = time.time() - cohere_start
             logger.info(
                 f"Cohere {llm_config.model} generated topic '{topic_name}' "
-                f"in {cohere_elapsed:.3f}s (API: {api_elapsed:.3f}s)"
+                f"in {cohere_elapsed:.3f}s"
             )
             return topic_name
 
@@ -234,6 +397,48 @@ class LLMProvider:
             )
             raise
 
+    async def _complete_cohere(
+        self,
+        prompt: str,
+        llm_config: LLMConfig,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """Send a single prompt to the Cohere Chat API and return the reply text."""
+        client = self._get_cohere_client(llm_config)
+
+        api_call_start = time.time()
+        logger.info(
+            f"Calling Cohere {llm_config.model} API (prompt length: {len(prompt)})"
+        )
+
+        # Call Cohere Chat API (v2 uses messages list format with proper types)
+        response = await client.chat(
+            model=llm_config.model,
+            messages=[UserChatMessageV2(role="user", content=prompt)],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+        api_elapsed = time.time() - api_call_start
+        logger.info(f"Cohere API call completed in {api_elapsed:.3f}s")
+
+        # Extract text from response message
+        if not response.message.content:
+            logger.error("Cohere returned empty response content")
+            raise ValueError("Cohere returned empty response content")
+
+        # Get the text content from the first content item
+        content_list = response.message.content
+        if not content_list or len(content_list) == 0:
+            logger.error("Cohere returned empty content list")
+            raise ValueError("Cohere returned empty content list")
+
+        content_item = content_list[0]
+        # Cast to TextAssistantMessageResponseContentItem to access text attribute
+        text_item = cast(TextAssistantMessageResponseContentItem, content_item)
+        return text_item.text.strip()
+
     async def _generate_openai(
         self,
         texts: List[str],
@@ -250,10 +455,6 @@ class LLMProvider:
         """
         openai_start = time.time()
         try:
-            logger.debug(f"Initializing OpenAI client for model {llm_config.model}")
-            client = OpenAI(api_key=llm_config.api_key)
-            logger.debug("OpenAI client initialized")
-
             sample_texts = texts[:samples_per_cluster]
             samples_text = "\n".join(sample_texts)
 
@@ -268,31 +469,14 @@ class LLMProvider:
                     f"Respond with ONLY the topic name, nothing else."
                 )
 
-            api_call_start = time.time()
-            logger.debug(
-                f"Calling OpenAI {llm_config.model} API (prompt length: {len(prompt)})"
+            topic_name = await self._complete_openai(
+                prompt, llm_config, max_tokens, temperature
             )
 
-            # Call OpenAI API
-            response = client.chat.completions.create(
-                model=llm_config.model or "gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
-
-            api_elapsed = time.time() - api_call_start
-            logger.debug(f"OpenAI API call completed in {api_elapsed:.3f}s")
-
-            message_content: Optional[str] = response.choices[0].message.content
-            if message_content is None:
-                logger.error("OpenAI returned empty response content")
-                raise ValueError("OpenAI returned empty response content")
-            topic_name: str = message_content.strip()
             openai_elapsed = time.time() - openai_start
             logger.info(
                 f"OpenAI {llm_config.model} generated topic '{topic_name}' "
-                f"in {openai_elapsed:.3f}s (API: {api_elapsed:.3f}s)"
+                f"in {openai_elapsed:.3f}s"
             )
             return topic_name
 
@@ -305,6 +489,40 @@ class LLMProvider:
             )
             raise
 
+    async def _complete_openai(
+        self,
+        prompt: str,
+        llm_config: LLMConfig,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """Send a single prompt to the OpenAI Chat Completions API and return the reply text."""
+        client = self._get_openai_client(llm_config)
+
+        api_call_start = time.time()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Calling OpenAI {llm_config.model} API (prompt length: {len(prompt)})"
+            )
+
+        # Call OpenAI API
+        response = await client.chat.completions.create(
+            model=llm_config.model or "gpt-4",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+        api_elapsed = time.time() - api_call_start
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"OpenAI API call completed in {api_elapsed:.3f}s")
+
+        message_content: Optional[str] = response.choices[0].message.content
+        if message_content is None:
+            logger.error("OpenAI returned empty response content")
+            raise ValueError("OpenAI returned empty response content")
+        return message_content.strip()
+
     async def _generate_internal(
         self,
         texts: List[str],
@@ -321,12 +539,6 @@ class LLMProvider:
         """
         internal_start = time.time()
         try:
-            # Get the internal LLM inference API URL from environment or default
-            api_url = os.environ.get("LLM_INFERENCE_API_URL", "http://localhost:8091")
-            logger.debug(
-                f"Initializing internal LLM client for model {llm_config.model} at {api_url}"
-            )
-
             sample_texts = texts[:samples_per_cluster]
             samples_text = "\n".join(sample_texts)
 
@@ -341,80 +553,14 @@ class LLMProvider:
                     f"Respond with ONLY the topic name, nothing else."
                 )
 
-            api_call_start = time.time()
-            logger.info(
-                f"Calling local LLM {llm_config.model} API (prompt length: {len(prompt)})"
+            topic_name = await self._complete_internal(
+                prompt, llm_config, max_tokens, temperature
             )
 
-            # Call local LLM inference API with retry/backoff for 503 errors
-            max_retries: int = 5
-            base_delay: float = 1.0  # Start with 1 second
-            result: Any = None
-
-            for attempt in range(max_retries):
-                try:
-                    async with httpx.AsyncClient(timeout=30.0) as client:
-                        response = await client.post(
-                            f"{api_url}/api/generate",
-                            json={
-                                "model": llm_config.model
-                                or "mistralai/Mistral-7B-Instruct-v0.2",
-                                "prompt": prompt,
-                                "max_tokens": max_tokens,
-                                "temperature": temperature,
-                            },
-                        )
-
-                        # Handle 503 Service Unavailable with exponential backoff
-                        if response.status_code == 503:
-                            if attempt < max_retries - 1:
-                                # Exponential backoff with jitter: 1s, 2s, 4s, 8s, 16s (+/- 10%)
-                                delay: float = base_delay * (2**attempt)
-                                jitter: float = delay * 0.1 * (random.random() - 0.5)
-                                total_delay: float = delay + jitter
-                                logger.warning(
-                                    f"LLM API returned 503, retrying in {total_delay:.2f}s "
-                                    f"(attempt {attempt + 1}/{max_retries})"
-                                )
-                                await asyncio.sleep(total_delay)
-                                continue
-                            else:
-                                logger.error(
-                                    f"LLM API returned 503 after {max_retries} attempts, giving up"
-                                )
-                                response.raise_for_status()
-
-                        response.raise_for_status()
-                        result = response.json()
-                        break
-
-                except httpx.HTTPStatusError as http_error:
-                    if (
-                        attempt < max_retries - 1
-                        and http_error.response.status_code == 503
-                    ):
-                        # Already handled above, continue to next attempt
-                        continue
-                    raise
-                except httpx.HTTPError:
-                    # Other HTTP errors (not status errors) - don't retry
-                    raise
-
-            api_elapsed = time.time() - api_call_start
-            logger.info(f"Internal LLM API call completed in {api_elapsed:.3f}s")
-
-            # Parse and extract text from response
-            try:
-                response_obj = InternalLLMResponse.from_dict(result)
-                topic_name: str = response_obj.get_content()
-            except ValueError as e:
-                logger.error(f"Failed to parse Internal LLM response: {e}")
-                raise
-
             internal_elapsed = time.time() - internal_start
             logger.info(
                 f"Internal LLM {llm_config.model} generated topic '{topic_name}' "
-                f"in {internal_elapsed:.3f}s (API: {api_elapsed:.3f}s)"
+                f"in {internal_elapsed:.3f}s"
             )
             return topic_name
 
@@ -426,3 +572,86 @@ class LLMProvider:
                 exc_info=True,
             )
             raise
+
+    async def _complete_internal(
+        self,
+        prompt: str,
+        llm_config: LLMConfig,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """Send a single prompt to the internal LLM inference API and return the reply text."""
+        api_url = self.internal_api_url
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Initializing internal LLM client for model {llm_config.model} at {api_url}"
+            )
+
+        api_call_start = time.time()
+        logger.info(
+            f"Calling local LLM {llm_config.model} API (prompt length: {len(prompt)})"
+        )
+
+        # Call local LLM inference API with retry/backoff for 503 errors
+        max_retries: int = 5
+        base_delay: float = 1.0  # Start with 1 second
+        result: Any = None
+
+        for attempt in range(max_retries):
+            try:
+                response = await self._http_client.post(
+                    f"{api_url}/api/generate",
+                    json={
+                        "model": llm_config.model
+                        or "mistralai/Mistral-7B-Instruct-v0.2",
+                        "prompt": prompt,
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                    },
+                )
+
+                # Handle 503 Service Unavailable with exponential backoff
+                if response.status_code == 503:
+                    if attempt < max_retries - 1:
+                        # Exponential backoff with jitter: 1s, 2s, 4s, 8s, 16s (+/- 10%)
+                        delay: float = base_delay * (2**attempt)
+                        jitter: float = delay * 0.1 * (random.random() - 0.5)
+                        total_delay: float = delay + jitter
+                        logger.warning(
+                            f"LLM API returned 503, retrying in {total_delay:.2f}s "
+                            f"(attempt {attempt + 1}/{max_retries})"
+                        )
+                        await asyncio.sleep(total_delay)
+                        continue
+                    else:
+                        logger.error(
+                            f"LLM API returned 503 after {max_retries} attempts, giving up"
+                        )
+                        response.raise_for_status()
+
+                response.raise_for_status()
+                result = response.json()
+                break
+
+            except httpx.HTTPStatusError as http_error:
+                if (
+                    attempt < max_retries - 1
+                    and http_error.response.status_code == 503
+                ):
+                    # Already handled above, continue to next attempt
+                    continue
+                raise
+            except httpx.HTTPError:
+                # Other HTTP errors (not status errors) - don't retry
+                raise
+
+        api_elapsed = time.time() - api_call_start
+        logger.info(f"Internal LLM API call completed in {api_elapsed:.3f}s")
+
+        # Parse and extract text from response
+        try:
+            response_obj = InternalLLMResponse.from_dict(result)
+        except ValueError as e:
+            logger.error(f"Failed to parse Internal LLM response: {e}")
+            raise
+        return response_obj.get_content()
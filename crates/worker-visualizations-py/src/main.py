@@ -7,18 +7,19 @@ and publishes results back to the result topic.
 """
 
 import asyncio
-import json
+import gc
 import logging
 import os
 import signal
 import sys
 import time
+import tracemalloc
 import uuid
 import nats
-from datetime import datetime, timezone
+import orjson
+from collections import deque
 from pathlib import Path
-from typing import Optional
-from aiohttp import web
+from typing import TYPE_CHECKING, Optional
 from nats.aio.msg import Msg
 from nats.aio.client import Client as NATSConnection
 from nats.js.api import ConsumerConfig
@@ -33,9 +34,9 @@ from opentelemetry.trace import SpanKind
 # Load environment variables from .env file
 # Look for .env in the parent directory (crates/worker-visualizations-py/)
 env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
+env_file_loaded = env_path.exists()
+if env_file_loaded:
     load_dotenv(dotenv_path=env_path)
-    print(f"Loaded environment from {env_path}")
 else:
     # Try loading from current directory as fallback
     load_dotenv()
@@ -43,25 +44,36 @@ else:
 try:
     # Try relative imports (for package execution)
     from .font_initializer import init_fonts_for_offline_mode
-    from .processor import process_visualization_job
+    from .processor import (
+        close_processors,
+        process_visualization_job,
+        shutdown_plot_pool,
+        warm_up_numba,
+    )
     from .models import (
         VisualizationTransformJob,
         VisualizationTransformResult,
     )
-    from .storage import S3Storage
     from .llm_namer import LLMProvider
-    from .observability import init_metrics
+    from .observability import classify_job_error, init_metrics, start_metrics_server
 except ImportError:
     # Fallback to absolute imports (for direct script execution)
     from font_initializer import init_fonts_for_offline_mode
-    from processor import process_visualization_job
+    from processor import (
+        close_processors,
+        process_visualization_job,
+        shutdown_plot_pool,
+        warm_up_numba,
+    )
     from models import (
         VisualizationTransformJob,
         VisualizationTransformResult,
     )
-    from storage import S3Storage
     from llm_namer import LLMProvider
-    from observability import init_metrics
+    from observability import classify_job_error, init_metrics, start_metrics_server
+
+if TYPE_CHECKING:
+    from storage import S3Storage
 
 # Initialize fonts for offline-only mode BEFORE any datamapplot usage
 # This must be done early to prevent any runtime font requests
@@ -74,51 +86,10 @@ WORKER_ID = os.getenv("WORKER_ID", str(uuid.uuid4()))
 metrics = init_metrics(WORKER_ID)
 
 
-# Configure structured JSON logging
-def configure_json_logging(worker_id: str):
-    """Configure JSON structured logging for production."""
-    log_level = os.getenv("LOG_LEVEL", "INFO")
-    log_format = os.getenv("LOG_FORMAT", "json").lower()
-
-    # Create logger
-    logger_instance = logging.getLogger()
-    logger_instance.setLevel(getattr(logging, log_level))
-
-    # Remove default handlers
-    for handler in logger_instance.handlers[:]:
-        logger_instance.removeHandler(handler)
-
-    handler = logging.StreamHandler(sys.stdout)
-
-    if log_format == "json":
-        # JSON structured logging formatter
-        class JSONFormatter(logging.Formatter):
-            def format(self, record):
-                log_obj = {
-                    "timestamp": datetime.fromtimestamp(
-                        record.created, tz=timezone.utc
-                    ).isoformat(),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                    "worker_id": worker_id,
-                }
-                if record.exc_info:
-                    log_obj["exception"] = self.formatException(record.exc_info)
-                return json.dumps(log_obj)
-
-        handler.setFormatter(JSONFormatter())
-    else:
-        # Human-readable format for development
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-
-    logger_instance.addHandler(handler)
-    return logger_instance
-
-
-logger = configure_json_logging(WORKER_ID)
+# Structured logging is configured by init_metrics (see observability.py)
+logger = logging.getLogger()
+if env_file_loaded:
+    logger.info(f"Loaded environment from {env_path}")
 
 # Configuration
 NATS_URL = os.getenv("NATS_URL", "nats://localhost:4222")
@@ -128,9 +99,24 @@ NATS_DURABLE_CONSUMER = "visualization-transform-workers"
 RESULT_SUBJECT_PREFIX = "transforms.visualization.status"
 NATS_STREAM_RETRY_ATTEMPTS = int(os.getenv("NATS_STREAM_RETRY_ATTEMPTS", "30"))
 NATS_STREAM_RETRY_DELAY = float(os.getenv("NATS_STREAM_RETRY_DELAY", "2.0"))
+NATS_BATCH_SIZE = int(os.getenv("NATS_BATCH_SIZE", "1"))
+NATS_FETCH_TIMEOUT = float(os.getenv("NATS_FETCH_TIMEOUT", "5.0"))
+# After this many consecutive fetch errors, re-create the subscription
+# to recover from lost consumers or stale subscriptions
+NATS_RESUBSCRIBE_THRESHOLD = int(os.getenv("NATS_RESUBSCRIBE_THRESHOLD", "10"))
 PROCESSING_TIMEOUT_SECS = int(os.getenv("PROCESSING_TIMEOUT_SECS", "3600"))
 HEALTH_CHECK_PORT = int(os.getenv("HEALTH_CHECK_PORT", "8081"))
 MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "3"))
+RESULT_PUBLISH_BATCH_SIZE = int(os.getenv("RESULT_PUBLISH_BATCH_SIZE", "32"))
+RESULT_PUBLISH_RETRY_ATTEMPTS = 3
+RESULT_PUBLISH_RETRY_BACKOFF_SECS = 0.2
+RESULT_OUTBOX_MAX_SIZE = 1024
+RESULT_OUTBOX_RETRY_INTERVAL_SECS = 1.0
+# Job payloads larger than this are decoded in a worker thread so validation
+# does not stall the event loop
+THREADED_DECODE_THRESHOLD_BYTES = 4096
+MONITOR_INTERVAL_SECS = float(os.getenv("MONITOR_INTERVAL_SECS", "60"))
+TRACEMALLOC_ENABLED = os.getenv("TRACEMALLOC_ENABLED", "false").lower() == "true"
 
 
 def build_status_subject(
@@ -143,6 +129,15 @@ def build_status_subject(
     return f"{RESULT_SUBJECT_PREFIX}.{owner}.{embedded_dataset_id}.{transform_id}"
 
 
+def _encode_result(result: VisualizationTransformResult) -> bytes:
+    """Serialize a result message to JSON bytes (camelCase keys, nulls omitted).
+
+    orjson serializes UUIDs natively and returns bytes, so the payload can be
+    published as-is.
+    """
+    return orjson.dumps(result.model_dump(by_alias=True, exclude_none=True))
+
+
 def extract_trace_context_from_headers(msg: Msg) -> dict:
     """Extract W3C trace context headers from NATS message.
 
@@ -159,15 +154,46 @@ def extract_trace_context_from_headers(msg: Msg) -> dict:
 
 
 # Global state
-s3_storage: Optional[S3Storage] = None
+s3_storage: Optional["S3Storage"] = None
 llm_provider: Optional[LLMProvider] = None
 shutdown_event: asyncio.Event = asyncio.Event()
 active_jobs = 0
 subscription_healthy = False  # Tracks whether the NATS subscription is functional
+# Strong references to the job worker tasks so they are never garbage collected
+# while running (the event loop only keeps weak references to tasks).
+_worker_tasks: set[asyncio.Task] = set()
+# Pending status/result publishes as (subject, payload, message to ack or None),
+# drained by publisher_loop so publishes share a single flush
+_result_queue: asyncio.Queue[tuple[str, bytes, Optional[Msg]]] = asyncio.Queue()
+# Results whose publish failed even after retries, re-sent by publisher_loop
+_result_outbox: deque[tuple[str, bytes, Optional[Msg]]] = deque()
+# Shared NATS connection, created on first use by get_nats_conn()
+_nc: Optional[NATSConnection] = None
+_nc_lock = asyncio.Lock()
+
+
+async def get_nats_conn() -> NATSConnection:
+    """Return the worker's shared NATS connection, connecting on first use.
+
+    The subscriber, job handlers and result publisher all share this one
+    connection. A new connection is only opened if the previous one has been
+    closed; while nats-py is reconnecting the existing client is returned.
+    """
+    global _nc
+    async with _nc_lock:
+        if _nc is None or _nc.is_closed:
+            _nc = await nats.connect(
+                NATS_URL,
+                max_reconnect_attempts=-1,
+                pending_size=8 * 1024 * 1024,
+            )
+        return _nc
 
 
 async def health_check_handler(_request):
     """Handle liveness probe request."""
+    from aiohttp import web
+
     return web.Response(text="OK", status=200)
 
 
@@ -177,6 +203,8 @@ async def readiness_check_handler(_request):
     Returns 503 when the NATS subscription is unhealthy (e.g., consumer lost),
     causing K8s to remove the pod from endpoints until recovery.
     """
+    from aiohttp import web
+
     if not subscription_healthy:
         return web.Response(text="Not Ready: NATS subscription unhealthy", status=503)
     return web.Response(text="Ready", status=200)
@@ -184,6 +212,10 @@ async def readiness_check_handler(_request):
 
 async def start_health_check_server():
     """Start health check HTTP server for Kubernetes probes."""
+    # Imported lazily: aiohttp's module graph is large and only needed once
+    # the worker is actually serving probes.
+    from aiohttp import web
+
     app = web.Application()
     app.router.add_get("/health/live", health_check_handler)
     app.router.add_get("/health/ready", readiness_check_handler)
@@ -215,7 +247,12 @@ async def initialize():
     start_time = time.time()
     logger.info(f"Initializing visualization worker {WORKER_ID}")
 
-    # Initialize S3 storage
+    # Initialize S3 storage (boto3 is imported lazily to keep cold start fast)
+    try:
+        from .storage import S3Storage
+    except ImportError:
+        from storage import S3Storage
+
     s3_start = time.time()
     s3_storage = S3Storage()
     s3_elapsed = time.time() - s3_start
@@ -229,6 +266,28 @@ async def initialize():
     metrics.llm_init_duration.observe(llm_elapsed)
     logger.info(f"LLM provider initialized in {llm_elapsed:.3f}s")
 
+    # Establish S3 and LLM connections and compile the numba kernels now so
+    # the first job does not pay for DNS, TLS, auth or JIT compilation
+    # inside its processing time
+    warm_start = time.time()
+    await asyncio.gather(
+        s3_storage.warm_up(),
+        llm_provider.warm_up(),
+        asyncio.to_thread(warm_up_numba),
+    )
+    logger.info(f"Client warm-up completed in {time.time() - warm_start:.3f}s")
+
+    # Per-message allocations are short-lived, so collect less eagerly, and
+    # move everything allocated during startup (imported modules, clients)
+    # into the permanent generation so full collections never rescan it
+    gen0, gen1, gen2 = gc.get_threshold()
+    gc.set_threshold(gen0 * 10, gen1 * 3, gen2 * 3)
+    gc.freeze()
+    logger.info(
+        f"GC thresholds set to {gc.get_threshold()}, "
+        f"{gc.get_freeze_count()} startup objects frozen"
+    )
+
     elapsed = time.time() - start_time
     logger.info(f"Worker initialization complete in {elapsed:.3f}s")
 
@@ -249,7 +308,7 @@ async def handle_job(
     global active_jobs
     active_jobs += 1
     metrics.active_jobs_gauge.set(active_jobs)
-    job_start_time = time.time()
+    job_start_ns = time.perf_counter_ns()
 
     logger.info(
         f"Processing job {job.job_id} for transform {job.visualization_transform_id} "
@@ -279,10 +338,13 @@ async def handle_job(
             status="processing",
             statsJson={"stage": "starting", "progress_percent": 0},
         )
-        progress_json = json.dumps(progress_result.model_dump_json_safe())
-        await nc.publish(status_subject, progress_json.encode())
+        _result_queue.put_nowait(
+            (status_subject, _encode_result(progress_result), None)
+        )
         logger.debug(
-            f"Sent initial progress update for job {job.job_id} to {status_subject}"
+            "Queued initial progress update for job %s to %s",
+            job.job_id,
+            status_subject,
         )
     except Exception as e:
         logger.warning(f"Failed to send initial progress update: {e}")
@@ -298,45 +360,52 @@ async def handle_job(
                 status="processing",
                 statsJson={"stage": stage, "progress_percent": progress_percent},
             )
-            progress_json = json.dumps(progress_result.model_dump_json_safe())
-            await nc.publish(status_subject, progress_json.encode())
+            _result_queue.put_nowait(
+                (status_subject, _encode_result(progress_result), None)
+            )
             logger.debug(
-                f"Progress update for job {job.job_id}: {stage} ({progress_percent}%)"
+                "Progress update for job %s: %s (%d%%)",
+                job.job_id,
+                stage,
+                progress_percent,
             )
         except Exception as e:
             logger.warning(f"Failed to send progress update: {e}")
 
     try:
         # Process the visualization job
-        process_start = time.time()
-        logger.debug(f"Starting visualization processing for job {job.job_id}")
+        process_start = time.perf_counter()
+        logger.debug("Starting visualization processing for job %s", job.job_id)
         processed_result = await asyncio.wait_for(
             process_visualization_job(
                 job, llm_provider, progress_callback=send_progress
             ),
             timeout=PROCESSING_TIMEOUT_SECS,
         )
-        process_elapsed = time.time() - process_start
+        process_elapsed = time.perf_counter() - process_start
         metrics.visualization_processing_duration.observe(process_elapsed)
         logger.info(f"Visualization processing completed in {process_elapsed:.3f}s")
 
         # Upload result to S3
         if s3_storage is None:
             raise RuntimeError("S3 storage not initialized")
-        s3_start = time.time()
-        logger.debug(f"Starting S3 upload for job {job.job_id}")
+        s3_start = time.perf_counter()
+        logger.debug("Starting S3 upload for job %s", job.job_id)
         s3_key = await s3_storage.upload_visualization(
             owner=job.owner_id,
             transform_id=job.visualization_transform_id,
             visualization_id=job.visualization_id,
             html_content=processed_result["html"],
         )
-        s3_elapsed = time.time() - s3_start
+        s3_elapsed = time.perf_counter() - s3_start
         metrics.visualization_s3_upload_duration.observe(s3_elapsed)
         logger.info(f"S3 upload completed in {s3_elapsed:.3f}s")
 
-        # Calculate processing duration
-        processing_duration_ms = int((time.time() - job_start_time) * 1000)
+        # Calculate processing duration (one clock read serves the result,
+        # the metrics and the log line)
+        job_elapsed_ns = time.perf_counter_ns() - job_start_ns
+        processing_duration_ms = job_elapsed_ns // 1_000_000
+        job_elapsed = job_elapsed_ns / 1e9
 
         # Update result with success
         result.status = "success"
@@ -347,14 +416,16 @@ async def handle_job(
         stats = processed_result.get("stats", {})
         stats["processing_duration_ms"] = processing_duration_ms
         result.stats_json = stats
+        # Drop the rendered HTML and any UMAP/datamapplot byproducts now rather
+        # than keeping them alive across the awaits below
+        del processed_result
 
         # Record metrics
-        metrics.visualization_jobs_total.labels("success").inc()
-        metrics.visualization_job_duration.observe((time.time() - job_start_time))
+        metrics.jobs_succeeded.inc()
+        metrics.visualization_job_duration.observe(job_elapsed)
         metrics.visualization_points_created.inc(result.point_count or 0)
         metrics.visualization_clusters_created.inc(result.cluster_count or 0)
 
-        job_elapsed = time.time() - job_start_time
         logger.info(
             f"Successfully completed job {job.job_id}: {result.point_count} points, "
             f"{result.cluster_count} clusters in {result.processing_duration_ms}ms "
@@ -364,54 +435,57 @@ async def handle_job(
     except asyncio.TimeoutError:
         result.status = "failed"
         result.error_message = f"Processing timeout after {PROCESSING_TIMEOUT_SECS}s"
-        job_elapsed = time.time() - job_start_time
-        metrics.visualization_jobs_total.labels("failed").inc()
+        job_elapsed = (time.perf_counter_ns() - job_start_ns) / 1e9
+        metrics.jobs_failed.inc()
         metrics.visualization_job_duration.observe(job_elapsed)
-        metrics.visualization_job_failures_total.labels("timeout").inc()
+        metrics.job_failures_by_type["timeout"].inc()
         logger.error(
             f"Job {job.job_id} timeout: {result.error_message} (elapsed: {job_elapsed:.3f}s)"
         )
     except Exception as e:
         result.status = "failed"
         result.error_message = f"{type(e).__name__}: {str(e)}"
-        job_elapsed = time.time() - job_start_time
-        metrics.visualization_jobs_total.labels("failed").inc()
+        job_elapsed = (time.perf_counter_ns() - job_start_ns) / 1e9
+        metrics.jobs_failed.inc()
         metrics.visualization_job_duration.observe(job_elapsed)
-        metrics.visualization_job_failures_total.labels(type(e).__name__).inc()
+        metrics.job_failures_by_type[classify_job_error(e)].inc()
         logger.error(
             f"Job {job.job_id} failed: {result.error_message} (elapsed: {job_elapsed:.3f}s)",
             exc_info=True,
         )
 
-    # Publish result back to Rust API
+    # Hand the result to the publisher, which acks the message once the
+    # publish has been flushed (or naks it for retry if the publish fails).
+    # The result holds only ids, counts and stats, so it is encoded inline
+    # like the progress updates; a thread hop would cost more than the dump.
     try:
-        logger.debug(f"Publishing result for job {job.job_id} to {status_subject}")
-        publish_start = time.time()
-        result_json = json.dumps(result.model_dump_json_safe())
-        await nc.publish(status_subject, result_json.encode())
-        publish_elapsed = time.time() - publish_start
+        payload = _encode_result(result)
+        _result_queue.put_nowait((status_subject, payload, msg))
         logger.info(
-            f"Published result for job {job.job_id} to {status_subject} "
-            f"(status: {result.status}, publish time: {publish_elapsed:.3f}s)"
+            f"Queued result for job {job.job_id} to {status_subject} "
+            f"(status: {result.status})"
         )
-
-        # Acknowledge the message
-        await msg.ack()
-        metrics.nats_messages_acked_total.inc()
-        logger.debug(f"Acknowledged message for job {job.job_id}")
     except Exception as e:
         logger.error(
-            f"Failed to publish result for job {job.job_id}: {e}", exc_info=True
+            f"Failed to serialize result for job {job.job_id}: {e}", exc_info=True
         )
         # Nack the message to retry
-        await msg.nak()
-        metrics.nats_messages_nacked_total.inc()
-        logger.warning(f"Nacked message for job {job.job_id} for retry")
+        try:
+            await msg.nak()
+            metrics.nats_messages_nacked_total.inc()
+            logger.warning(f"Nacked message for job {job.job_id} for retry")
+        except Exception as nak_error:
+            logger.warning(f"Failed to nak job message: {nak_error}")
     finally:
         # Update health state and decrement active jobs
         active_jobs -= 1
         metrics.active_jobs_gauge.set(active_jobs)
-        logger.debug(f"Job {job.job_id} completed, active jobs: {active_jobs}")
+        logger.debug("Job %s completed, active jobs: %d", job.job_id, active_jobs)
+
+
+def _is_json_syntax_error(error: ValidationError) -> bool:
+    """Return True if validation failed because the payload is not valid JSON."""
+    return any(err["type"] == "json_invalid" for err in error.errors())
 
 
 async def message_handler(msg: Msg, nc: NATSConnection) -> None:
@@ -432,10 +506,15 @@ async def message_handler(msg: Msg, nc: NATSConnection) -> None:
     ) as span:
         try:
             logger.debug("Received NATS message, parsing payload")
-            # Parse the message payload
-            job_data = json.loads(msg.data.decode())
-            job = VisualizationTransformJob(**job_data)
-            logger.debug(f"Successfully parsed job {job.job_id}")
+            # Parse and validate the payload in a single pass (pydantic-core
+            # decodes the JSON bytes directly, no intermediate dict)
+            if len(msg.data) > THREADED_DECODE_THRESHOLD_BYTES:
+                job = await asyncio.to_thread(
+                    VisualizationTransformJob.model_validate_json, msg.data
+                )
+            else:
+                job = VisualizationTransformJob.model_validate_json(msg.data)
+            logger.debug("Successfully parsed job %s", job.job_id)
 
             # Add job info to span
             span.set_attribute("job.id", str(job.job_id))
@@ -446,22 +525,31 @@ async def message_handler(msg: Msg, nc: NATSConnection) -> None:
             await handle_job(nc, msg, job)
 
         except ValidationError as e:
+            if _is_json_syntax_error(e):
+                logger.error(f"Failed to parse job JSON: {e}", exc_info=True)
+                span.set_attribute("error", True)
+                span.set_attribute("error.type", "json_decode_error")
+                metrics.job_failures_by_type["validation"].inc()
+                try:
+                    await msg.ack()
+                    metrics.nats_messages_acked_total.inc()
+                    logger.info(
+                        "Acknowledged malformed message to prevent reprocessing"
+                    )
+                except Exception as ack_error:
+                    logger.warning(f"Failed to ack job message: {ack_error}")
+                return
             logger.error(f"Invalid job payload: {e}", exc_info=True)
             span.set_attribute("error", True)
             span.set_attribute("error.type", "validation_error")
+            metrics.job_failures_by_type["validation"].inc()
             # Ack the message to avoid reprocessing invalid data
-            await msg.ack()
-            metrics.nats_messages_acked_total.inc()
-            metrics.visualization_job_failures_total.labels("validation_error").inc()
-            logger.info("Acknowledged invalid message to prevent reprocessing")
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse job JSON: {e}", exc_info=True)
-            span.set_attribute("error", True)
-            span.set_attribute("error.type", "json_decode_error")
-            await msg.ack()
-            metrics.nats_messages_acked_total.inc()
-            metrics.visualization_job_failures_total.labels("json_decode_error").inc()
-            logger.info("Acknowledged malformed message to prevent reprocessing")
+            try:
+                await msg.ack()
+                metrics.nats_messages_acked_total.inc()
+                logger.info("Acknowledged invalid message to prevent reprocessing")
+            except Exception as ack_error:
+                logger.warning(f"Failed to ack job message: {ack_error}")
         except Exception as e:
             handler_elapsed = time.time() - handler_start
             logger.error(
@@ -471,10 +559,195 @@ async def message_handler(msg: Msg, nc: NATSConnection) -> None:
             span.set_attribute("error", True)
             span.set_attribute("error.type", "unexpected_error")
             span.record_exception(e)
-            await msg.nak()
-            metrics.nats_messages_nacked_total.inc()
-            metrics.visualization_job_failures_total.labels("unexpected_error").inc()
-            logger.warning("Nacked message due to unexpected error")
+            metrics.job_failures_by_type["internal"].inc()
+            try:
+                await msg.nak()
+                metrics.nats_messages_nacked_total.inc()
+                logger.warning("Nacked message due to unexpected error")
+            except Exception as nak_error:
+                logger.warning(f"Failed to nak job message: {nak_error}")
+
+
+async def job_worker(job_queue: asyncio.Queue, nc: NATSConnection) -> None:
+    """Drain the job queue, handling one message at a time.
+
+    A fixed number of these run concurrently, which bounds job concurrency
+    without creating a task per message.
+    """
+    while True:
+        msg = await job_queue.get()
+        try:
+            await message_handler(msg, nc)
+        except Exception as e:
+            # Keep the worker alive; the message is redelivered after ack_wait
+            logger.error(f"Job worker failed to handle message: {e}", exc_info=True)
+        finally:
+            job_queue.task_done()
+
+
+async def _publish_with_retry(
+    nc: NATSConnection, items: list[tuple[str, bytes, Optional[Msg]]]
+) -> bool:
+    """Publish items and flush, retrying with exponential backoff.
+
+    Returns:
+        True once a flush succeeds, False after RESULT_PUBLISH_RETRY_ATTEMPTS failures
+    """
+    for attempt in range(1, RESULT_PUBLISH_RETRY_ATTEMPTS + 1):
+        try:
+            publish_start = time.time()
+            for subject, payload, _ in items:
+                await nc.publish(subject, payload)
+            await nc.flush()
+            publish_elapsed = time.time() - publish_start
+            logger.debug(
+                "Published %d status updates in %.3fs", len(items), publish_elapsed
+            )
+            return True
+        except Exception as e:
+            if attempt == RESULT_PUBLISH_RETRY_ATTEMPTS:
+                logger.error(
+                    f"Failed to publish batch of {len(items)} status updates "
+                    f"after {attempt} attempts: {e}",
+                    exc_info=True,
+                )
+                return False
+            backoff = RESULT_PUBLISH_RETRY_BACKOFF_SECS * 2 ** (attempt - 1)
+            logger.warning(
+                f"Failed to publish batch of {len(items)} status updates "
+                f"(attempt {attempt}/{RESULT_PUBLISH_RETRY_ATTEMPTS}): {e}. "
+                f"Retrying in {backoff:.1f}s"
+            )
+            await asyncio.sleep(backoff)
+    return False
+
+
+async def _park_result(item: tuple[str, bytes, Optional[Msg]]) -> None:
+    """Hold an unpublished job result in the outbox for a later attempt.
+
+    Progress updates are dropped, since a newer one will follow. If the
+    outbox is full, the job message is nacked so the job is redelivered.
+    """
+    job_msg = item[2]
+    if job_msg is None:
+        return
+    if len(_result_outbox) < RESULT_OUTBOX_MAX_SIZE:
+        _result_outbox.append(item)
+        return
+    logger.warning("Result outbox full, nacking job message for redelivery")
+    try:
+        await job_msg.nak()
+        metrics.nats_messages_nacked_total.inc()
+    except Exception as e:
+        logger.warning(f"Failed to nak job message: {e}")
+
+
+async def publisher_loop(nc: NATSConnection) -> None:
+    """Publish queued job results in batches.
+
+    Takes whatever is already queued (up to RESULT_PUBLISH_BATCH_SIZE items),
+    publishes it, and issues a single flush for the whole batch. Job messages
+    are acked only after the flush succeeds. Results that still fail after
+    retries are parked in the outbox and re-sent with a later batch (or on
+    their own once the connection is back) rather than nacked straight away,
+    so a short NATS outage does not redeliver every finished job.
+    """
+    while True:
+        batch: list[tuple[str, bytes, Optional[Msg]]] = []
+        if _result_outbox:
+            try:
+                batch.append(
+                    await asyncio.wait_for(
+                        _result_queue.get(), timeout=RESULT_OUTBOX_RETRY_INTERVAL_SECS
+                    )
+                )
+            except asyncio.TimeoutError:
+                pass
+        else:
+            batch.append(await _result_queue.get())
+        while len(batch) < RESULT_PUBLISH_BATCH_SIZE:
+            try:
+                batch.append(_result_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        # Parked results go out first once the connection is usable again
+        items = list(batch)
+        if _result_outbox and nc.is_connected:
+            items = list(_result_outbox) + items
+            _result_outbox.clear()
+
+        if items:
+            if await _publish_with_retry(nc, items):
+                for _, _, job_msg in items:
+                    if job_msg is None:
+                        continue
+                    try:
+                        await job_msg.ack()
+                        metrics.nats_messages_acked_total.inc()
+                    except Exception as e:
+                        logger.warning(f"Failed to ack job message: {e}")
+            else:
+                for item in items:
+                    await _park_result(item)
+
+        for _ in batch:
+            _result_queue.task_done()
+
+
+async def _monitor(job_queue: asyncio.Queue) -> None:
+    """Periodically log worker task and queue state.
+
+    With TRACEMALLOC_ENABLED=true, also logs the top allocation sites so slow
+    memory growth across jobs can be traced back to its source.
+    """
+    while True:
+        await asyncio.sleep(MONITOR_INTERVAL_SECS)
+        logger.info(
+            f"Worker state: {len(_worker_tasks)} job workers, {active_jobs} active jobs, "
+            f"{job_queue.qsize()} queued jobs, {_result_queue.qsize()} pending results"
+        )
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            top_stats = tracemalloc.take_snapshot().statistics("lineno")[:5]
+            logger.info(
+                f"Traced memory: {current / 1024 / 1024:.1f} MiB "
+                f"(peak {peak / 1024 / 1024:.1f} MiB); top allocations: "
+                + "; ".join(str(stat) for stat in top_stats)
+            )
+
+
+async def enqueue_message(job_queue: asyncio.Queue, msg: Msg) -> bool:
+    """Hand a fetched message to the worker pool.
+
+    Blocks while every worker is busy, which keeps back-pressure on the
+    JetStream consumer. If shutdown is requested while waiting, the message
+    is nacked so it can be redelivered to another worker.
+
+    Returns:
+        True if the message was queued, False if it was returned to the stream
+    """
+    if not job_queue.full():
+        job_queue.put_nowait(msg)
+        return True
+
+    put_task = asyncio.create_task(job_queue.put(msg))
+    shutdown_task = asyncio.create_task(shutdown_event.wait())
+    done, pending = await asyncio.wait(
+        {put_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED
+    )
+    for task in pending:
+        task.cancel()
+
+    if put_task in done:
+        return True
+
+    try:
+        await msg.nak()
+        metrics.nats_messages_nacked_total.inc()
+    except Exception as e:
+        logger.warning(f"Failed to nak job message: {e}")
+    return False
 
 
 async def _create_pull_subscription(js):
@@ -515,8 +788,14 @@ async def _create_pull_subscription(js):
                     subject=NATS_SUBJECT,
                     durable=NATS_DURABLE_CONSUMER,
                     config=ConsumerConfig(
-                        ack_wait=1800,  # 30 minutes
+                        # Must outlast a job that runs to the processing
+                        # timeout, plus upload/publish and time queued locally,
+                        # or the job is redelivered while still running
+                        ack_wait=PROCESSING_TIMEOUT_SECS + 300,
                         max_deliver=3,
+                        # Shared by every worker replica (matches the API's
+                        # consumer config); per-worker concurrency is bounded
+                        # by the local job queue instead
                         max_ack_pending=10,
                     ),
                 )
@@ -554,6 +833,13 @@ async def main():
     # Setup signal handlers for graceful shutdown
     setup_signal_handlers()
 
+    # Start the Prometheus endpoint first so initialization metrics are scrapeable
+    metrics_runner = None
+    try:
+        metrics_runner = await start_metrics_server()
+    except OSError as e:
+        logger.error(f"Failed to start Prometheus metrics server: {e}")
+
     init_start = time.time()
     await initialize()
     init_elapsed = time.time() - init_start
@@ -569,11 +855,14 @@ async def main():
     nc: Optional[NATSConnection] = None
     message_count = 0
     psub = None
+    job_queue: Optional[asyncio.Queue] = None
+    publisher_task: Optional[asyncio.Task] = None
+    monitor_task: Optional[asyncio.Task] = None
     try:
         # Connect to NATS
         nats_start = time.time()
         logger.debug(f"Connecting to NATS at {NATS_URL}")
-        nc = await nats.connect(NATS_URL)
+        nc = await get_nats_conn()
         nats_elapsed = time.time() - nats_start
         logger.info(f"Connected to NATS at {NATS_URL} in {nats_elapsed:.3f}s")
 
@@ -582,38 +871,44 @@ async def main():
             raise RuntimeError("NATS connection not established")
         js = nc.jetstream()
 
+        # Single publisher task that batches result publishes
+        publisher_task = asyncio.create_task(
+            publisher_loop(nc), name="result-publisher"
+        )
+
         # Create pull subscription (with retry for stream availability)
         psub = await _create_pull_subscription(js)
         subscription_healthy = True
 
         # Message loop with pull-based fetching and subscription recovery
         logger.info("Worker started, waiting for jobs...")
-        batch_size = int(os.getenv("NATS_BATCH_SIZE", "1"))
-        fetch_timeout = float(os.getenv("NATS_FETCH_TIMEOUT", "5.0"))
         consecutive_errors = 0
         max_backoff = 30  # Maximum backoff in seconds
-        # After this many consecutive errors, re-create the subscription
-        # to recover from lost consumers or stale subscriptions
-        max_consecutive_errors_before_resubscribe = int(
-            os.getenv("NATS_RESUBSCRIBE_THRESHOLD", "10")
-        )
 
-        # Semaphore to bound concurrent job processing.
-        # Without this, asyncio.create_task() would spawn unbounded tasks,
-        # potentially exhausting memory on CPU-heavy visualization jobs.
-        job_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+        # Fixed pool of job workers draining a bounded queue.
+        # The fetch loop blocks once the queue is full, so at most
+        # MAX_CONCURRENT_JOBS jobs run and at most as many more wait locally.
+        job_queue = asyncio.Queue(maxsize=MAX_CONCURRENT_JOBS)
+        for worker_index in range(MAX_CONCURRENT_JOBS):
+            task = asyncio.create_task(
+                job_worker(job_queue, nc), name=f"job-worker-{worker_index}"
+            )
+            _worker_tasks.add(task)
+            task.add_done_callback(_worker_tasks.discard)
         logger.info(f"Concurrency limited to {MAX_CONCURRENT_JOBS} concurrent jobs")
 
-        async def bounded_message_handler(msg: Msg, nc: NATSConnection):
-            """Wrap message_handler with semaphore for bounded concurrency."""
-            async with job_semaphore:
-                await message_handler(msg, nc)
+        if TRACEMALLOC_ENABLED:
+            tracemalloc.start()
+            logger.info("tracemalloc enabled for memory diagnostics")
+        monitor_task = asyncio.create_task(_monitor(job_queue), name="worker-monitor")
 
         while not shutdown_event.is_set():
             try:
                 # Fetch messages from the pull subscription
                 # This allows multiple workers to compete for messages
-                messages = await psub.fetch(batch=batch_size, timeout=fetch_timeout)
+                messages = await psub.fetch(
+                    batch=NATS_BATCH_SIZE, timeout=NATS_FETCH_TIMEOUT
+                )
                 consecutive_errors = 0  # Reset on success
                 if not subscription_healthy:
                     subscription_healthy = True
@@ -627,9 +922,8 @@ async def main():
                         break
 
                     message_count += 1
-                    logger.debug(f"Received message #{message_count} from queue")
-                    # Create a bounded task for message handling
-                    asyncio.create_task(bounded_message_handler(msg, nc))
+                    logger.debug("Received message #%d from queue", message_count)
+                    await enqueue_message(job_queue, msg)
 
             except asyncio.TimeoutError:
                 # No messages available, continue polling
@@ -648,7 +942,7 @@ async def main():
                 if "serviceunavailable" in error_str or "no responders" in error_str:
                     # After too many consecutive errors, the consumer may have been
                     # lost (e.g., due to cluster issues). Re-create the subscription.
-                    if consecutive_errors >= max_consecutive_errors_before_resubscribe:
+                    if consecutive_errors >= NATS_RESUBSCRIBE_THRESHOLD:
                         subscription_healthy = False
                         logger.warning(
                             f"Consumer appears unavailable after {consecutive_errors} consecutive errors. "
@@ -692,20 +986,56 @@ async def main():
         logger.error(f"Fatal error in main loop: {e}", exc_info=True)
         sys.exit(1)
     finally:
-        # Gracefully wait for active jobs to complete
-        if active_jobs > 0:
-            logger.info(f"Waiting for {active_jobs} active jobs to complete...")
-            max_wait = 300  # 5 minutes max wait for jobs
-            wait_start = time.time()
-            while active_jobs > 0 and (time.time() - wait_start) < max_wait:
-                await asyncio.sleep(1)
-
+        if job_queue is not None:
+            # Messages that no worker has picked up yet go straight back to
+            # the stream instead of being started during shutdown
+            while not job_queue.empty():
+                queued_msg = job_queue.get_nowait()
+                job_queue.task_done()
+                try:
+                    await queued_msg.nak()
+                    metrics.nats_messages_nacked_total.inc()
+                except Exception as e:
+                    logger.warning(f"Failed to nak queued message on shutdown: {e}")
+
+            # Gracefully wait for active jobs to complete
             if active_jobs > 0:
+                logger.info(f"Waiting for {active_jobs} active jobs to complete...")
+                max_wait = 300  # 5 minutes max wait for jobs
+                try:
+                    await asyncio.wait_for(job_queue.join(), timeout=max_wait)
+                    logger.info("All active jobs completed")
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"{active_jobs} jobs still active after {max_wait}s timeout"
+                    )
+
+        # Stop the job workers and the monitor
+        if monitor_task is not None:
+            monitor_task.cancel()
+        for task in list(_worker_tasks):
+            task.cancel()
+        await asyncio.gather(*_worker_tasks, return_exceptions=True)
+
+        # Let queued results reach NATS (and their messages get acked)
+        if publisher_task is not None:
+            try:
+                await asyncio.wait_for(_result_queue.join(), timeout=30)
+            except asyncio.TimeoutError:
                 logger.warning(
-                    f"{active_jobs} jobs still active after {max_wait}s timeout"
+                    f"{_result_queue.qsize()} results still unpublished at shutdown"
                 )
-            else:
-                logger.info("All active jobs completed")
+            publisher_task.cancel()
+            await asyncio.gather(publisher_task, return_exceptions=True)
+
+        # Results that never made it out are returned to the stream
+        while _result_outbox:
+            _, _, parked_msg = _result_outbox.popleft()
+            try:
+                await parked_msg.nak()
+                metrics.nats_messages_nacked_total.inc()
+            except Exception as e:
+                logger.warning(f"Failed to nak parked result message on shutdown: {e}")
 
         # Close NATS connection
         if nc is not None:
@@ -713,12 +1043,21 @@ async def main():
             await nc.close()
             logger.info("NATS connection closed")
 
+        if llm_provider is not None:
+            await llm_provider.close()
+
         # Shutdown health check server
         if health_runner is not None:
             logger.debug("Shutting down health check server")
             await health_runner.cleanup()
             logger.info("Health check server shut down")
 
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
+
+        shutdown_plot_pool()
+        await close_processors()
+
         total_elapsed = time.time() - main_start
         logger.info(
             f"Worker stopped (processed {message_count} messages, "
@@ -727,4 +1066,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is a faster drop-in event loop; fall back to asyncio where it is
+    # unavailable (e.g. Windows development machines)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
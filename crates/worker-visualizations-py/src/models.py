@@ -6,10 +6,17 @@ Pydantic models for NATS message deserialization and result publishing.
 
 from typing import Any, Dict, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+# Default topic naming template; the API and UI send the same text when the user
+# has not edited it
+DEFAULT_TOPIC_NAMING_PROMPT = "These are representative texts from a document cluster:\n\n{{samples}}\n\nProvide a short, concise topic name (2-4 words) that captures the main theme. Respond with ONLY the topic name, nothing else."
 
 
 class QdrantConnectionConfig(BaseModel):
+    # Immutable and hashable, so it can key cached client connections
+    model_config = ConfigDict(frozen=True)
+
     url: str
     api_key: Optional[str] = None
 
@@ -17,6 +24,8 @@ class QdrantConnectionConfig(BaseModel):
 class VisualizationConfig(BaseModel):
     """Visualization generation parameters."""
 
+    model_config = ConfigDict(frozen=True)
+
     # UMAP parameters
     n_neighbors: int = Field(default=15, description="UMAP n_neighbors parameter")
     min_dist: float = Field(default=0.1, description="UMAP min_dist parameter")
@@ -32,13 +41,20 @@ class VisualizationConfig(BaseModel):
 
     # LLM naming configuration
     llm_batch_size: int = Field(
-        default=10, description="Number of clusters to process in parallel (1-100)"
+        default=10, description="Number of clusters named per LLM request (1-100)"
     )
     samples_per_cluster: int = Field(
         default=5,
         description="Number of sample texts to send to LLM per cluster (1-100)",
     )
 
+    # Point hover texts
+    hover_text: bool = Field(
+        default=True,
+        description="Show point texts on hover; when false, payloads are only "
+        "fetched for the points sampled for LLM naming",
+    )
+
     # Datamapplot create_interactive_plot parameters
     inline_data: bool = Field(
         default=True,
@@ -173,7 +189,7 @@ class VisualizationConfig(BaseModel):
     # LLM naming is conditional: only applied if llm_config is provided in the job
     # If no LLM config, numeric cluster labels are used
     topic_naming_prompt: str = Field(
-        default="These are representative texts from a document cluster:\n\n{{samples}}\n\nProvide a short, concise topic name (2-4 words) that captures the main theme. Respond with ONLY the topic name, nothing else.",
+        default=DEFAULT_TOPIC_NAMING_PROMPT,
         description="Custom prompt template for LLM topic naming. Use {{samples}} as placeholder for the sample texts.",
     )
 
@@ -187,9 +203,9 @@ class LLMConfig(BaseModel):
     api_key: str
     config: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        # Allow extra fields from API response
-        extra = "allow"
+    # Allow extra fields from API response; read-only once received, but not
+    # hashable since the config field is a dict
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class VisualizationTransformJob(BaseModel):
@@ -205,8 +221,9 @@ class VisualizationTransformJob(BaseModel):
     qdrant_config: QdrantConnectionConfig
     llm_config: Optional[LLMConfig] = None
 
-    class Config:
-        json_encoders = {UUID: str}
+    @field_serializer("job_id", when_used="json")
+    def _serialize_job_id(self, job_id: UUID) -> str:
+        return str(job_id)
 
 
 class VisualizationTransformResult(BaseModel):
@@ -226,13 +243,5 @@ class VisualizationTransformResult(BaseModel):
     error_message: Optional[str] = Field(default=None, alias="errorMessage")
     stats_json: Dict[str, Any] = Field(default_factory=dict, alias="statsJson")
 
-    class Config:
-        populate_by_name = True  # Allow both snake_case and camelCase fields
-
-    def model_dump_json_safe(self, **kwargs) -> Dict[str, Any]:
-        """Convert model to dict with proper JSON serialization for UUID and datetime."""
-        data = self.model_dump(by_alias=True, exclude_none=True, **kwargs)
-        # Ensure UUID is converted to string
-        if isinstance(data.get("jobId"), UUID):
-            data["jobId"] = str(data["jobId"])
-        return data
+    # Allow both snake_case and camelCase fields
+    model_config = ConfigDict(populate_by_name=True)
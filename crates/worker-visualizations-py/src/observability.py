@@ -3,28 +3,100 @@ OpenTelemetry instrumentation for Visualization Worker
 
 Provides metrics, tracing, and logging integration with the semantic-explorer
 observability stack. Exports Prometheus metrics on port 9090.
+
+Logging on hot paths: prefer lazy %-style arguments
+(``logger.debug("job %s", job_id)``), which are only formatted if the record
+passes the level check. Where the message needs an f-string or other work to
+build, guard it with ``if logger.isEnabledFor(logging.DEBUG):`` so nothing is
+computed when DEBUG is off in production.
 """
 
-import json
+import asyncio
+import atexit
+import gzip
 import logging
+import multiprocessing.util
 import os
+import queue
 import sys
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
 
+import orjson
 from prometheus_client import (
     Counter,
     Gauge,
     Histogram,
     CollectorRegistry,
-    start_http_server,
+    REGISTRY,
 )
-from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
-from opentelemetry.exporter.jaeger.thrift import JaegerExporter
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource
+from prometheus_client.exposition import choose_encoder, gzip_accepted
+
+# The OpenTelemetry SDK and the OTLP/gRPC exporter are imported lazily in
+# setup_observability, so workers running with tracing disabled never load them
+if TYPE_CHECKING:
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+
+logger = logging.getLogger(__name__)
+
+# Allowed values of the error_type label on visualization_job_failures_total.
+# Label values must come from this fixed set (see classify_job_error) so an
+# unexpected exception class can never create a new time series.
+JOB_ERROR_TYPES = ("timeout", "s3", "llm", "qdrant", "validation", "nats", "internal")
+
+PROMETHEUS_METRICS_PORT = int(os.getenv("PROMETHEUS_METRICS_PORT", "9090"))
+
+# How long a rendered /metrics response is reused before the registry is
+# serialized again (0 disables caching)
+PROMETHEUS_SCRAPE_CACHE_SECS = float(os.getenv("PROMETHEUS_SCRAPE_CACHE_SECS", "5"))
+
+# Histogram buckets. Every bucket is a separate series per label set, so each
+# histogram gets only as many buckets as its latency range needs; adding
+# buckets improves quantile fidelity at the cost of scrape size.
+# Whole jobs and the compute-bound stages run for seconds to minutes
+_JOB_DURATION_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, float("inf"))
+_STAGE_DURATION_BUCKETS = (0.5, 1.0, 5.0, 10.0, 30.0, 60.0, float("inf"))
+# Vector fetches and S3 uploads are mostly sub-second
+_IO_DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, float("inf"))
+# Initialization happens once per process
+_INIT_DURATION_BUCKETS = (1.0, 5.0, float("inf"))
+
+# Top-level package of an exception's class -> error_type
+_ERROR_TYPE_BY_PACKAGE = {
+    "botocore": "s3",
+    "boto3": "s3",
+    "s3transfer": "s3",
+    "openai": "llm",
+    "cohere": "llm",
+    "qdrant_client": "qdrant",
+    "grpc": "qdrant",
+    "nats": "nats",
+    "pydantic": "validation",
+    "pydantic_core": "validation",
+}
+
+
+def classify_job_error(error: BaseException) -> str:
+    """Map an exception to one of JOB_ERROR_TYPES for the failures metric."""
+    if isinstance(error, TimeoutError):
+        return "timeout"
+    package = type(error).__module__.split(".", 1)[0]
+    return _ERROR_TYPE_BY_PACKAGE.get(package, "internal")
+
+
+def _get_or_create(metric_cls, name: str, *args, registry=None, **kwargs):
+    """Return the collector already registered under name, or create it.
+
+    Constructing Metrics a second time against the same registry (tests,
+    re-initialization) reuses the existing collectors instead of failing with
+    "Duplicated timeseries in CollectorRegistry".
+    """
+    existing = (registry or REGISTRY)._names_to_collectors.get(name)
+    if existing is not None:
+        return existing
+    return metric_cls(name, *args, registry=registry or REGISTRY, **kwargs)
 
 
 class Metrics:
@@ -35,141 +107,303 @@ class Metrics:
         self.registry = registry
 
         # Job execution metrics - matching Rust worker structure
-        self.visualization_jobs_total = Counter(
+        self.visualization_jobs_total = _get_or_create(
+            Counter,
             "visualization_transform_jobs_total",
             "Total number of visualization transform jobs processed",
             ["status"],
             registry=registry,
         )
 
-        self.visualization_job_duration = Histogram(
+        self.visualization_job_duration = _get_or_create(
+            Histogram,
             "visualization_transform_duration_seconds",
             "Duration of visualization transform jobs in seconds",
-            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float("inf")),
+            buckets=_JOB_DURATION_BUCKETS,
             registry=registry,
         )
 
-        self.visualization_points_created = Counter(
+        self.visualization_points_created = _get_or_create(
+            Counter,
             "visualization_transform_points_created",
             "Total number of visualization points created",
             registry=registry,
         )
 
-        self.visualization_clusters_created = Counter(
+        self.visualization_clusters_created = _get_or_create(
+            Counter,
             "visualization_transform_clusters_created",
             "Total number of clusters created by visualization transforms",
             registry=registry,
         )
 
         # Processing stage metrics
-        self.visualization_processing_duration = Histogram(
+        self.visualization_processing_duration = _get_or_create(
+            Histogram,
             "visualization_processing_duration_seconds",
             "Duration of the actual visualization processing (excluding I/O)",
-            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf")),
+            buckets=_JOB_DURATION_BUCKETS,
             registry=registry,
         )
 
-        self.visualization_s3_upload_duration = Histogram(
+        self.visualization_s3_upload_duration = _get_or_create(
+            Histogram,
             "visualization_s3_upload_duration_seconds",
             "Duration of S3 uploads for visualization results",
-            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf")),
+            buckets=_IO_DURATION_BUCKETS,
             registry=registry,
         )
 
-        # Job failure and retry tracking
-        self.visualization_job_failures_total = Counter(
+        # Job failure and retry tracking. error_type is always one of
+        # JOB_ERROR_TYPES; map exceptions with classify_job_error()
+        self.visualization_job_failures_total = _get_or_create(
+            Counter,
             "visualization_job_failures_total",
             "Total number of visualization job failures",
             ["error_type"],
             registry=registry,
         )
 
-        self.visualization_job_retries_total = Counter(
+        self.visualization_job_retries_total = _get_or_create(
+            Counter,
             "visualization_job_retries_total",
             "Total number of visualization job retries",
             registry=registry,
         )
 
         # NATS message metrics
-        self.nats_messages_received_total = Counter(
+        self.nats_messages_received_total = _get_or_create(
+            Counter,
             "nats_messages_received_total",
             "Total number of NATS messages received",
             registry=registry,
         )
 
-        self.nats_messages_acked_total = Counter(
+        self.nats_messages_acked_total = _get_or_create(
+            Counter,
             "nats_messages_acked_total",
             "Total number of NATS messages acknowledged",
             registry=registry,
         )
 
-        self.nats_messages_nacked_total = Counter(
+        self.nats_messages_nacked_total = _get_or_create(
+            Counter,
             "nats_messages_nacked_total",
             "Total number of NATS messages nacked (negative acknowledged)",
             registry=registry,
         )
 
+        # Tracing backpressure: spans discarded because the export queue was full
+        self.otel_spans_dropped_total = _get_or_create(
+            Counter,
+            "otel_spans_dropped_total",
+            "Total number of spans dropped because the span export queue was full",
+            registry=registry,
+        )
+
         # Worker state metrics
-        self.active_jobs_gauge = Gauge(
+        self.active_jobs_gauge = _get_or_create(
+            Gauge,
             "visualization_active_jobs",
             "Number of visualization jobs currently being processed",
             registry=registry,
         )
 
-        self.worker_ready = Gauge(
+        self.worker_ready = _get_or_create(
+            Gauge,
             "visualization_worker_ready",
             "1 if worker is ready, 0 otherwise",
             registry=registry,
         )
 
         # Component initialization times
-        self.s3_init_duration = Histogram(
+        self.s3_init_duration = _get_or_create(
+            Histogram,
             "visualization_s3_init_duration_seconds",
             "Duration of S3 storage initialization",
-            buckets=(0.1, 0.5, 1.0, 5.0, 10.0, float("inf")),
+            buckets=_INIT_DURATION_BUCKETS,
             registry=registry,
         )
 
-        self.llm_init_duration = Histogram(
+        self.llm_init_duration = _get_or_create(
+            Histogram,
             "visualization_llm_init_duration_seconds",
             "Duration of LLM provider initialization",
-            buckets=(0.1, 0.5, 1.0, 5.0, 10.0, float("inf")),
+            buckets=_INIT_DURATION_BUCKETS,
             registry=registry,
         )
 
         # Granular operation timing metrics
-        self.visualization_fetch_vectors_duration = Histogram(
+        self.visualization_fetch_vectors_duration = _get_or_create(
+            Histogram,
             "visualization_fetch_vectors_duration_seconds",
             "Duration to fetch vectors for visualization in seconds",
             ["status"],
-            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf")),
+            buckets=_IO_DURATION_BUCKETS,
             registry=registry,
         )
 
-        self.visualization_umap_duration = Histogram(
+        self.visualization_umap_duration = _get_or_create(
+            Histogram,
             "visualization_umap_duration_seconds",
             "Duration to run UMAP dimensionality reduction in seconds",
             ["status"],
-            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float("inf")),
+            buckets=_STAGE_DURATION_BUCKETS,
             registry=registry,
         )
 
-        self.visualization_hdbscan_duration = Histogram(
+        self.visualization_hdbscan_duration = _get_or_create(
+            Histogram,
             "visualization_hdbscan_duration_seconds",
             "Duration to run HDBSCAN clustering in seconds",
             ["status"],
-            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf")),
+            buckets=_STAGE_DURATION_BUCKETS,
             registry=registry,
         )
 
-        self.visualization_plot_duration = Histogram(
+        self.visualization_plot_duration = _get_or_create(
+            Histogram,
             "visualization_plot_duration_seconds",
             "Duration to generate visualization plots in seconds",
             ["status"],
-            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf")),
+            buckets=_STAGE_DURATION_BUCKETS,
             registry=registry,
         )
 
+        # Pre-bound label children for the hot paths: recording skips the
+        # per-call label lookup, and every series is exported from startup
+        self.jobs_succeeded = self.visualization_jobs_total.labels("success")
+        self.jobs_failed = self.visualization_jobs_total.labels("failed")
+        self.job_failures_by_type = {
+            error_type: self.visualization_job_failures_total.labels(error_type)
+            for error_type in JOB_ERROR_TYPES
+        }
+        self.stage_durations = {
+            stage: {
+                status: histogram.labels(status=status)
+                for status in ("success", "error")
+            }
+            for stage, histogram in (
+                ("fetch_vectors", self.visualization_fetch_vectors_duration),
+                ("umap", self.visualization_umap_duration),
+                ("hdbscan", self.visualization_hdbscan_duration),
+                ("plot", self.visualization_plot_duration),
+            )
+        }
+
+
+class _MetricsEndpoint:
+    """aiohttp handler that serves the default registry for Prometheus.
+
+    prometheus_client re-serializes (and gzips) the whole registry on every
+    request. Rendering runs in a worker thread so it never blocks the event
+    loop, and the result is cached per Accept header and gzip support for
+    PROMETHEUS_SCRAPE_CACHE_SECS, so repeated scrapes within the TTL (e.g. an
+    HA Prometheus pair) are served from memory.
+    """
+
+    def __init__(self, ttl_secs: float):
+        self._ttl_secs = ttl_secs
+        self._cache: Dict[Tuple[str, bool], Tuple[float, bytes, Dict[str, str]]] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _render(accept: str, use_gzip: bool) -> Tuple[bytes, Dict[str, str]]:
+        encoder, content_type = choose_encoder(accept)
+        body = encoder(REGISTRY)
+        headers = {"Content-Type": content_type}
+        if use_gzip:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
+
+    async def __call__(self, request):
+        from aiohttp import web
+
+        key = (
+            request.headers.get("Accept", ""),
+            gzip_accepted(request.headers.get("Accept-Encoding", "")),
+        )
+        async with self._lock:
+            cached = self._cache.get(key)
+            now = time.monotonic()
+            if cached is None or cached[0] <= now:
+                body, headers = await asyncio.to_thread(self._render, *key)
+                cached = (now + self._ttl_secs, body, headers)
+                if self._ttl_secs > 0:
+                    self._cache[key] = cached
+
+        _, body, headers = cached
+        return web.Response(body=body, headers=headers)
+
+
+async def start_metrics_server(port: int = PROMETHEUS_METRICS_PORT):
+    """Serve /metrics on the running event loop; returns the aiohttp runner."""
+    # Imported lazily, like the health check server in main.py
+    from aiohttp import web
+
+    app = web.Application()
+    app.router.add_get("/metrics", _MetricsEndpoint(PROMETHEUS_SCRAPE_CACHE_SECS))
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "0.0.0.0", port)
+    await site.start()
+    logger.info(f"Prometheus metrics server started on port {port}")
+    return runner
+
+
+# Resource per (service_name, worker_id), built once per process
+_RESOURCE_CACHE: Dict[Tuple[str, str], "Resource"] = {}
+
+
+def _get_resource(service_name: str, worker_id: str) -> "Resource":
+    """Return the tracing Resource identifying this worker, creating it once."""
+    key = (service_name, worker_id)
+    resource = _RESOURCE_CACHE.get(key)
+    if resource is None:
+        from opentelemetry.sdk.resources import Resource
+
+        resource = Resource.create(
+            {
+                "service.name": service_name,
+                "service.version": "1.0.0",
+                "service.instance.id": worker_id,
+            }
+        )
+        _RESOURCE_CACHE[key] = resource
+    return resource
+
+
+def _batch_span_processor(
+    exporter: "SpanExporter", dropped_spans: Counter
+) -> "BatchSpanProcessor":
+    """Wrap an exporter in a BatchSpanProcessor tuned for bursty job traffic.
+
+    Spans are queued on span end and exported from a background thread. The
+    SDK silently discards spans once the queue is full; each discarded span is
+    counted in dropped_spans. The standard OTEL_BSP_* variables override the
+    defaults below.
+    """
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    class CountingBatchSpanProcessor(BatchSpanProcessor):
+        def on_end(self, span) -> None:
+            # Mirrors BatchSpanProcessor.on_end: unsampled spans are never queued
+            if span.context and span.context.trace_flags.sampled:
+                batch = self._batch_processor
+                if len(batch._queue) >= batch._max_queue_size:
+                    dropped_spans.inc()
+            super().on_end(span)
+
+    return CountingBatchSpanProcessor(
+        exporter,
+        max_queue_size=int(os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "10000")),
+        max_export_batch_size=int(os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "512")),
+        schedule_delay_millis=float(os.getenv("OTEL_BSP_SCHEDULE_DELAY", "1000")),
+        export_timeout_millis=float(os.getenv("OTEL_BSP_EXPORT_TIMEOUT", "10000")),
+    )
+
 
 def setup_observability(
     worker_id: str, service_name: str = "worker-visualizations"
@@ -186,97 +420,254 @@ def setup_observability(
     """
     # Configuration from environment
     otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
-    prometheus_port = int(os.getenv("PROMETHEUS_METRICS_PORT", "9090"))
+    trace_sample_ratio = float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "1.0"))
     log_level = os.getenv("LOG_LEVEL", "INFO")
     log_format = os.getenv("LOG_FORMAT", "json").lower()
 
-    # Resource for identifying this worker
-    resource = Resource.create(
-        {
-            "service.name": service_name,
-            "service.version": "1.0.0",
-            "service.instance.id": worker_id,
-        }
-    )
+    # Configure structured logging first so setup messages below use it
+    configure_structured_logging(worker_id, log_format, log_level)
 
     # Initialize Prometheus metrics with default registry
     metrics_obj = Metrics()
 
-    # Start Prometheus HTTP server for metrics scraping
-    try:
-        start_http_server(prometheus_port)
-        logging.info(f"Prometheus metrics server started on port {prometheus_port}")
-    except OSError as e:
-        logging.error(
-            f"Failed to start Prometheus metrics server on port {prometheus_port}: {e}"
-        )
+    # The /metrics endpoint is served on the worker's event loop; see
+    # start_metrics_server
+
+    if os.getenv("OTEL_SDK_DISABLED", "false").lower() == "true":
+        logger.info("OpenTelemetry SDK disabled, tracing not configured")
+        return metrics_obj
 
     # Setup Tracing
     try:
-        trace_provider = TracerProvider(resource=resource)
-
-        # Add Jaeger exporter for traces
-        jaeger_exporter = JaegerExporter(
-            agent_host_name="localhost",
-            agent_port=6831,
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        # Sample new traces at the configured ratio; jobs that arrive with a
+        # trace context from the API follow the upstream sampling decision
+        trace_provider = TracerProvider(
+            resource=_get_resource(service_name, worker_id),
+            sampler=ParentBased(TraceIdRatioBased(trace_sample_ratio)),
         )
-        trace_provider.add_span_processor(SimpleSpanProcessor(jaeger_exporter))
 
-        # Also add OTLP exporter for traces
+        # Export traces over OTLP (Jaeger and the collector both ingest OTLP)
         otlp_span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
-        trace_provider.add_span_processor(BatchSpanProcessor(otlp_span_exporter))
+        trace_provider.add_span_processor(
+            _batch_span_processor(
+                otlp_span_exporter, metrics_obj.otel_spans_dropped_total
+            )
+        )
 
         trace.set_tracer_provider(trace_provider)
-        logging.debug("Tracing configured with Jaeger and OTLP exporters")
+        logger.debug("Tracing configured with OTLP exporter")
     except Exception as e:  # noqa: BLE001
-        logging.warning(f"Failed to initialize tracing: {e}")
-
-    # Configure structured logging
-    configure_structured_logging(worker_id, log_format, log_level)
+        logger.warning(f"Failed to initialize tracing: {e}")
 
     return metrics_obj
 
 
+class AsyncLogHandler(logging.Handler):
+    """Logging handler that hands records to a background writer thread.
+
+    emit() only resolves the message and enqueues the record. The writer
+    thread drains the queue in batches, formats each record and writes the
+    whole batch to the stream with a single write() and flush(), so log calls
+    never format, serialize or do I/O on the caller's thread.
+    """
+
+    def __init__(
+        self,
+        stream=None,
+        max_queue_size: int = 10000,
+        max_batch_size: int = 256,
+    ):
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stdout
+        self.max_batch_size = max_batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        # Records dropped while the queue was full; bumped on caller threads
+        # and reset by the writer thread, so guarded by a lock
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="log-writer", daemon=True
+        )
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # Resolve %-args now so later mutation of the arguments cannot
+            # change the message; exc_info is kept for the formatter
+            record.msg = record.getMessage()
+            record.args = None
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def _writer_loop(self) -> None:
+        while True:
+            record = self.queue.get()
+            if record is None:
+                return
+            batch = [record]
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+            self._write_batch(batch)
+            if stopping:
+                return
+
+    def _write_batch(self, batch: list) -> None:
+        lines = []
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            # Formatted like any other record so JSON output stays parseable
+            batch.insert(
+                0,
+                logging.LogRecord(
+                    name=__name__,
+                    level=logging.WARNING,
+                    pathname=__file__,
+                    lineno=0,
+                    msg=f"Log queue full: dropped {dropped} log records",
+                    args=None,
+                    exc_info=None,
+                ),
+            )
+        for record in batch:
+            try:
+                lines.append(self.format(record))
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+        if not lines:
+            return
+        try:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+        except Exception:  # noqa: BLE001
+            self.handleError(batch[-1])
+
+    def close(self) -> None:
+        """Flush queued records and stop the writer thread."""
+        if self._writer.is_alive():
+            self.queue.put(None)
+            self._writer.join(timeout=5)
+        super().close()
+
+
+_log_handler: Optional[AsyncLogHandler] = None
+# (worker_id, log_format, log_level) of the last configure_structured_logging
+# call, so child processes can log the same way
+_logging_args: Optional[Tuple[str, str, str]] = None
+
+
+def _stop_log_handler() -> None:
+    """Flush queued log records and stop the writer thread."""
+    global _log_handler
+    if _log_handler is not None:
+        _log_handler.close()
+        _log_handler = None
+
+
+atexit.register(_stop_log_handler)
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects tagged with the worker ID."""
+
+    def __init__(self, worker_id: str):
+        super().__init__()
+        # The worker_id field never changes, so it is serialized once and
+        # spliced onto the end of every record
+        self._worker_id_suffix = b',"worker_id":' + orjson.dumps(worker_id) + b"}"
+        self._cached_second = -1
+        self._cached_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        # Records arrive in bursts within the same second, so the date/time
+        # prefix is formatted once per second and reused
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        micros = int((created - second) * 1_000_000)
+        return f"{self._cached_prefix}.{micros:06d}+00:00"
+
+    def format(self, record):
+        log_obj: Dict[str, Any] = {
+            "timestamp": self._timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log_obj["exception"] = self.formatException(record.exc_info)
+        return (orjson.dumps(log_obj)[:-1] + self._worker_id_suffix).decode()
+
+
 def configure_structured_logging(
     worker_id: str, log_format: str = "json", log_level: str = "INFO"
 ):
-    """Configure structured logging."""
+    """Configure structured logging.
+
+    Log calls only enqueue the record; formatting and writing to stdout happen
+    on a background writer thread so they never block the event loop.
+    """
+    global _log_handler, _logging_args
+    _logging_args = (worker_id, log_format, log_level)
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level))
 
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_log_handler()
 
     # Create new handler
-    handler = logging.StreamHandler(sys.stdout)
+    handler = AsyncLogHandler(sys.stdout)
 
     if log_format == "json":
-
-        class JSONFormatter(logging.Formatter):
-            def format(self, record):
-                log_obj: Dict[str, Any] = {
-                    "timestamp": datetime.fromtimestamp(
-                        record.created, tz=timezone.utc
-                    ).isoformat(),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                    "worker_id": worker_id,
-                }
-                if record.exc_info:
-                    log_obj["exception"] = self.formatException(record.exc_info)
-                return json.dumps(log_obj)
-
-        handler.setFormatter(JSONFormatter())
+        handler.setFormatter(JSONFormatter(worker_id))
     else:
         handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
 
+    _log_handler = handler
     root_logger.addHandler(handler)
 
 
+def get_logging_args() -> Optional[Tuple[str, str, str]]:
+    """Arguments for configure_child_process_logging, or None if logging is unset."""
+    return _logging_args
+
+
+def configure_child_process_logging(
+    worker_id: str, log_format: str = "json", log_level: str = "INFO"
+) -> None:
+    """Process pool initializer: configure structured logging in the child.
+
+    multiprocessing children skip atexit handlers, so queued records are
+    flushed by a multiprocessing finalizer when the child exits.
+    """
+    configure_structured_logging(worker_id, log_format, log_level)
+    multiprocessing.util.Finalize(None, _stop_log_handler, exitpriority=10)
+
+
 # Global metrics instance
 _metrics: Optional[Metrics] = None
 
@@ -290,7 +681,8 @@ def get_metrics() -> Metrics:
 
 
 def init_metrics(worker_id: str) -> Metrics:
-    """Initialize global metrics instance."""
+    """Initialize global metrics instance (only the first call sets it up)."""
     global _metrics
-    _metrics = setup_observability(worker_id)
+    if _metrics is None:
+        _metrics = setup_observability(worker_id)
     return _metrics
@@ -6,35 +6,298 @@ interactive visualization generation.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import logging
+import multiprocessing
 import time
-import tempfile
 import os
-from typing import Any, Dict, Optional
+import warnings
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
 
+import numba
 import numpy as np
 import random
-from qdrant_client import AsyncQdrantClient
+from qdrant_client import AsyncQdrantClient, grpc
 from umap import UMAP
+from umap.umap_ import nearest_neighbors
 from fast_hdbscan import HDBSCAN
 import datamapplot
 
+# Optional GPU backend (RAPIDS cuML). Not in requirements.txt: install it in a
+# CUDA image to run UMAP and HDBSCAN on the GPU for large jobs
+try:
+    import cupy
+    from cuml.cluster import HDBSCAN as CuHDBSCAN
+    from cuml.manifold import UMAP as CuUMAP
+except ImportError:
+    cupy = None
+    CuHDBSCAN = None
+    CuUMAP = None
+
 # Maximum points to visualize to prevent OOM
 MAX_POINTS = int(os.environ.get("MAX_VISUALIZATION_POINTS", 100_000_000))
 
+# Qdrant retrieve() calls kept in flight while fetching points, and points per call
+QDRANT_RETRIEVE_CONCURRENCY = int(os.environ.get("QDRANT_RETRIEVE_CONCURRENCY", 8))
+QDRANT_RETRIEVE_BATCH_SIZE = 1000
+# Point IDs per scroll page (IDs only, so pages can be large)
+QDRANT_SCROLL_BATCH_SIZE = 10_000
+QDRANT_GRPC_TIMEOUT_SECS = 60
+
+# HDBSCAN input dimensionality limit: above ~50 dims the tree-based core
+# distance search degrades towards brute force, so reduce (UMAP) first
+HDBSCAN_MAX_DIMS = 50
+# Numba threads used by fast_hdbscan (0 = numba's default, all cores)
+HDBSCAN_NUM_THREADS = int(os.environ.get("HDBSCAN_NUM_THREADS", 0))
+
+# Seed UMAP and its kNN search so a collection always gets the same layout.
+# umap-learn runs single-threaded when seeded; "false" drops the seed and uses
+# all cores instead
+UMAP_DETERMINISTIC = os.environ.get("UMAP_DETERMINISTIC", "true").lower() == "true"
+
+# Minimum point count for running UMAP on the GPU when cuML is installed
+GPU_UMAP_MIN_POINTS = int(os.environ.get("GPU_UMAP_MIN_POINTS", 50_000))
+# Minimum point count for running HDBSCAN on the GPU when cuML is installed
+GPU_HDBSCAN_MIN_POINTS = int(os.environ.get("GPU_HDBSCAN_MIN_POINTS", 1_000_000))
+
+# Directory for caching UMAP k-nearest-neighbour graphs and finished 2-D layouts
+# between runs on the same vectors (unset = disabled). Below
+# UMAP_KNN_CACHE_MIN_POINTS UMAP computes exact pairwise distances instead of a
+# kNN graph, so there is nothing worth caching
+UMAP_KNN_CACHE_DIR = os.environ.get("UMAP_KNN_CACHE_DIR", "")
+UMAP_KNN_CACHE_MIN_POINTS = 4096
+# Neighbours stored per cached graph. Runs with any n_neighbors up to this
+# reuse the same graph (sliced), so n_neighbors sweeps share one kNN build
+UMAP_KNN_CACHE_NEIGHBORS = int(os.environ.get("UMAP_KNN_CACHE_NEIGHBORS", 64))
+
+# Processes running the datamapplot plot step. It is mostly pure Python and in a
+# thread would hold the GIL against the event loop and other jobs' work
+# (0 = run it in the default thread pool instead)
+PLOT_PROCESS_WORKERS = int(os.environ.get("PLOT_PROCESS_WORKERS", 1))
+
+# Characters of each sample text sent to the LLM for topic naming; hover texts
+# carry the full document body, which adds latency and cost but not signal
+LLM_SAMPLE_MAX_CHARS = int(os.environ.get("LLM_SAMPLE_MAX_CHARS", 240))
+
+# Maximum concurrent LLM requests while naming the clusters of one job
+LLM_NAMING_CONCURRENCY = int(os.environ.get("LLM_NAMING_CONCURRENCY", 4))
+
 try:
     # Try relative imports (for package execution)
-    from .models import VisualizationTransformJob, VisualizationConfig
+    from .models import (
+        DEFAULT_TOPIC_NAMING_PROMPT,
+        QdrantConnectionConfig,
+        VisualizationTransformJob,
+        VisualizationConfig,
+    )
     from .llm_namer import LLMProvider
     from .font_patcher import patch_html_fonts, verify_no_external_requests
+    from .observability import (
+        configure_child_process_logging,
+        get_logging_args,
+        get_metrics,
+    )
 except ImportError:
     # Fallback to absolute imports (for direct script execution)
-    from models import VisualizationTransformJob, VisualizationConfig
+    from models import (
+        DEFAULT_TOPIC_NAMING_PROMPT,
+        QdrantConnectionConfig,
+        VisualizationTransformJob,
+        VisualizationConfig,
+    )
     from llm_namer import LLMProvider
     from font_patcher import patch_html_fonts, verify_no_external_requests
+    from observability import (
+        configure_child_process_logging,
+        get_logging_args,
+        get_metrics,
+    )
 
 logger = logging.getLogger(__name__)
 
+
+def _record_stage_duration(stage: str, status: str, duration: float) -> None:
+    """Record a pipeline stage duration (no-op when metrics are not initialized)."""
+    try:
+        get_metrics().stage_durations[stage][status].observe(duration)
+    except RuntimeError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _gpu_available() -> bool:
+    """True if cuML is installed and a CUDA device is visible."""
+    if cupy is None:
+        return False
+    try:
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:  # noqa: BLE001 - no driver / no device
+        return False
+
+
+def _label_counts(labels: np.ndarray) -> tuple[np.ndarray, int, int]:
+    """Count points per cluster label in one pass.
+
+    Returns (label_counts, cluster_count, noise_count), where label_counts is
+    indexed by label + 1 so that noise (-1) is slot 0. HDBSCAN labels are
+    dense from 0, so a bincount replaces sorting them with np.unique.
+    """
+    label_counts = np.bincount(labels + 1, minlength=1)
+    return label_counts, int(np.count_nonzero(label_counts[1:])), int(label_counts[0])
+
+
+def _members_by_centrality(
+    cluster_indices: np.ndarray, coords: np.ndarray
+) -> np.ndarray:
+    """Order a cluster's point indices by distance to the cluster centroid."""
+    member_coords = coords[cluster_indices]
+    centroid_dists = np.square(member_coords - member_coords.mean(axis=0)).sum(axis=1)
+    return cluster_indices[np.argsort(centroid_dists, kind="stable")]
+
+
+def _point_id_to_grpc(point_id) -> grpc.PointId:
+    """Convert a point ID returned by scroll() (int or UUID string) to gRPC."""
+    if isinstance(point_id, int):
+        return grpc.PointId(num=point_id)
+    return grpc.PointId(uuid=str(point_id))
+
+
+def _decode_dense_vector(vector_output) -> np.ndarray:
+    """Decode a gRPC vector to float32 without creating a Python float per value.
+
+    A serialized DenseVector is a single packed field: tag byte 0x0A, the
+    payload length as a varint, then little-endian float32 values, so the
+    values are read straight out of the serialized bytes. Anything else falls
+    back to reading the repeated field element by element.
+
+    Raises:
+        ValueError: If the vector is sparse, multi-dense or empty
+    """
+    kind = vector_output.WhichOneof("vector")
+    if kind in ("sparse", "multi_dense"):
+        raise ValueError(f"Expected a dense vector, got a {kind} vector")
+    dense = vector_output.dense if kind == "dense" else vector_output
+    raw = dense.SerializeToString()
+    payload_len = 4 * len(dense.data)
+    if not payload_len:
+        raise ValueError("Point has an empty vector")
+    if raw[0] == 0x0A:
+        # Skip the varint length prefix
+        header_len = 1
+        while raw[header_len] & 0x80:
+            header_len += 1
+        header_len += 1
+        if header_len + payload_len == len(raw):
+            return np.frombuffer(raw, dtype="<f4", offset=header_len)
+    return np.asarray(dense.data, dtype=np.float32)
+
+
+def _umap_cache_key(vectors: np.ndarray, metric: str) -> str:
+    """Cache key for these exact vectors under this metric."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{vectors.shape}|{vectors.dtype}|{metric}".encode())
+    digest.update(memoryview(np.ascontiguousarray(vectors)).cast("B"))
+    return digest.hexdigest()
+
+
+def _load_umap_cache(path: str, *names: str) -> Optional[tuple[np.ndarray, ...]]:
+    """Load the named arrays of a cache entry, or None if absent or unreadable."""
+    try:
+        with np.load(path) as cached:
+            return tuple(cached[name] for name in names)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # noqa: BLE001 - a bad cache entry only costs a recompute
+        logger.warning(f"Ignoring unreadable UMAP cache {path}: {type(e).__name__}: {e}")
+        return None
+
+
+def _save_umap_cache(path: str, **arrays: np.ndarray) -> None:
+    """Write a cache entry atomically (best effort)."""
+    try:
+        os.makedirs(UMAP_KNN_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write UMAP cache {path}: {e}")
+
+
+_plot_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_plot_pool() -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    """Return the shared plot process pool (None when PLOT_PROCESS_WORKERS is 0)."""
+    global _plot_pool
+    if PLOT_PROCESS_WORKERS <= 0:
+        return None
+    if _plot_pool is None:
+        # spawn rather than fork: this process runs executor, log writer and
+        # span exporter threads, and forking a multi-threaded process can
+        # leave the child deadlocked on a lock one of them held. A spawned
+        # child starts with no logging setup, so it is configured like this
+        # process to keep plot-stage logs structured and tagged with worker_id
+        logging_args = get_logging_args()
+        _plot_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=PLOT_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=configure_child_process_logging if logging_args else None,
+            initargs=logging_args or (),
+        )
+    return _plot_pool
+
+
+def _umap_seed_kwargs() -> dict[str, Any]:
+    """random_state and n_jobs for the CPU UMAP and kNN calls."""
+    if UMAP_DETERMINISTIC:
+        # Explicit n_jobs=1: umap-learn forces it when seeded and warns otherwise
+        return {"random_state": 42, "n_jobs": 1}
+    return {"random_state": None, "n_jobs": -1}
+
+
+def _plot_worker_ready() -> None:
+    """No-op submitted to the plot pool to start its worker process early."""
+
+
+def shutdown_plot_pool() -> None:
+    """Stop the plot process pool; the next plot starts a fresh one."""
+    global _plot_pool
+    if _plot_pool is not None:
+        _plot_pool.shutdown(wait=False, cancel_futures=True)
+        _plot_pool = None
+
+
+def warm_up_numba(metric: str = "cosine") -> None:
+    """Compile the UMAP, kNN and HDBSCAN numba kernels on a tiny dataset.
+
+    numba compiles each kernel on its first call in the process, which
+    otherwise lands inside the first job's UMAP and HDBSCAN timings.
+    """
+    warm_start = time.time()
+    data = np.random.default_rng(42).random((100, 8), dtype=np.float32)
+    # UMAP only runs NN-descent from 4096 points up, so build one directly
+    # Same seeding as real jobs: the parallel kernels are separate compilations
+    seed_kwargs = _umap_seed_kwargs()
+    nearest_neighbors(
+        data,
+        5,
+        metric,
+        {},
+        False,
+        np.random.RandomState(seed_kwargs["random_state"]),
+        n_jobs=seed_kwargs["n_jobs"],
+    )
+    embedding = UMAP(
+        n_neighbors=5, n_components=2, metric=metric, **seed_kwargs
+    ).fit_transform(data)
+    HDBSCAN(min_cluster_size=5).fit_predict(embedding)
+    logger.info(f"Numba warm-up completed in {time.time() - warm_start:.3f}s")
+
+
 # Datamapplot cache file names
 DATAMAPPLOT_FONTS_CACHE = "datamapplot_fonts_encoded.json"
 DATAMAPPLOT_JS_CACHE = "datamapplot_js_encoded.json"
@@ -106,16 +369,16 @@ def _find_cache_file(filename: str) -> Optional[str]:
 class VisualizationProcessor:
     """Processes vectors and generates interactive visualizations."""
 
-    def __init__(self, qdrant_url: str):
+    def __init__(self, qdrant_url: str, qdrant_api_key: Optional[str] = None):
         """Initialize processor with Qdrant connection using gRPC."""
         init_start = time.time()
-        # Convert HTTP URL to gRPC URL
-        grpc_url = qdrant_url
-        logger.debug(f"Converting Qdrant URL: {qdrant_url} -> {grpc_url}")
-        self.qdrant = AsyncQdrantClient(url=grpc_url, prefer_grpc=True)
+        # prefer_grpc takes the HTTP URL as-is and derives the gRPC port itself
+        self.qdrant = AsyncQdrantClient(
+            url=qdrant_url, api_key=qdrant_api_key, prefer_grpc=True
+        )
         init_elapsed = time.time() - init_start
         logger.info(
-            f"Initialized Async Qdrant client in {init_elapsed:.3f}s: {grpc_url}"
+            f"Initialized Async Qdrant client in {init_elapsed:.3f}s: {qdrant_url}"
         )
 
         # Pre-locate cache files for offline mode
@@ -137,6 +400,14 @@ class VisualizationProcessor:
         # Track if we've already patched requests
         self._requests_patched = False
 
+    def __getstate__(self):
+        """Pickle state for the plot process, which needs no Qdrant client."""
+        state = self.__dict__.copy()
+        del state["qdrant"]
+        # requests.get is patched per process
+        state["_requests_patched"] = False
+        return state
+
     def _get_font_cache_path(self) -> Optional[str]:
         """Get path to datamapplot font cache file."""
         return self._font_cache_path
@@ -206,7 +477,7 @@ class VisualizationProcessor:
 
         Returns:
             Dictionary with keys:
-            - html: Generated interactive HTML
+            - html: Generated interactive HTML (UTF-8 encoded bytes)
             - point_count: Number of points
             - cluster_count: Number of clusters
             - stats: Processing statistics
@@ -218,6 +489,17 @@ class VisualizationProcessor:
             f"Starting visualization processing for transform {job.visualization_transform_id}"
         )
 
+        # Start the plot process (spawn plus the datamapplot/numba imports
+        # take tens of seconds) while the fetch, UMAP and HDBSCAN stages run;
+        # once it is up this is a no-op round trip
+        plot_pool = _get_plot_pool()
+        if plot_pool is not None:
+            try:
+                plot_pool.submit(_plot_worker_ready)
+            except BrokenProcessPool:
+                # Replaced by a fresh pool when the plot stage asks for one
+                shutdown_plot_pool()
+
         # Fetch vectors from Qdrant (0-20%)
         if progress_callback:
             await progress_callback("fetching_vectors", 5)
@@ -226,33 +508,17 @@ class VisualizationProcessor:
         )
         fetch_start = time.time()
         try:
-            vectors, _ids, texts = await self._fetch_vectors_from_qdrant(
-                job.qdrant_collection_name, job.owner_id
+            vectors, ids, texts = await self._fetch_vectors_from_qdrant(
+                job.qdrant_collection_name,
+                job.owner_id,
+                with_payload=job.visualization_config.hover_text,
             )
             fetch_duration = time.time() - fetch_start
             # Record fetch vectors timing
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_fetch_vectors_duration.labels(
-                        status="success"
-                    ).observe(fetch_duration)
-            except Exception:
-                pass
+            _record_stage_duration("fetch_vectors", "success", fetch_duration)
         except Exception as e:
             fetch_duration = time.time() - fetch_start
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_fetch_vectors_duration.labels(
-                        status="error"
-                    ).observe(fetch_duration)
-            except Exception:
-                pass
+            _record_stage_duration("fetch_vectors", "error", fetch_duration)
             raise e
         if progress_callback:
             await progress_callback("fetching_vectors", 20)
@@ -277,28 +543,10 @@ class VisualizationProcessor:
                 None, self._run_umap, vectors, job
             )
             umap_duration = time.time() - umap_start
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_umap_duration.labels(
-                        status="success"
-                    ).observe(umap_duration)
-            except Exception:
-                pass
+            _record_stage_duration("umap", "success", umap_duration)
         except Exception as e:
             umap_duration = time.time() - umap_start
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_umap_duration.labels(status="error").observe(
-                        umap_duration
-                    )
-            except Exception:
-                pass
+            _record_stage_duration("umap", "error", umap_duration)
             raise e
         if progress_callback:
             await progress_callback("applying_umap", 50)
@@ -317,28 +565,10 @@ class VisualizationProcessor:
                 None, self._run_hdbscan, umap_vectors, job
             )
             hdbscan_duration = time.time() - hdbscan_start
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_hdbscan_duration.labels(
-                        status="success"
-                    ).observe(hdbscan_duration)
-            except Exception:
-                pass
+            _record_stage_duration("hdbscan", "success", hdbscan_duration)
         except Exception as e:
             hdbscan_duration = time.time() - hdbscan_start
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_hdbscan_duration.labels(
-                        status="error"
-                    ).observe(hdbscan_duration)
-            except Exception:
-                pass
+            _record_stage_duration("hdbscan", "error", hdbscan_duration)
             raise e
         if progress_callback:
             await progress_callback("clustering", 70)
@@ -346,8 +576,21 @@ class VisualizationProcessor:
         # Generate cluster labels/names (70-85%)
         if progress_callback:
             await progress_callback("naming_clusters", 72)
+        label_counts, unique_clusters, noise_points = _label_counts(labels)
+        naming_texts = texts
+        if not job.visualization_config.hover_text and job.llm_config is not None:
+            # No hover texts were fetched: retrieve payloads only for the
+            # points that may be sampled for topic naming
+            naming_texts = await self._fetch_naming_texts(
+                job.qdrant_collection_name,
+                ids,
+                labels,
+                label_counts,
+                umap_vectors,
+                job.visualization_config.samples_per_cluster,
+            )
         cluster_labels = await self._generate_cluster_labels(
-            labels, texts, job, llm_provider
+            labels, naming_texts, job, llm_provider, umap_vectors, label_counts
         )
         if progress_callback:
             await progress_callback("naming_clusters", 85)
@@ -356,11 +599,12 @@ class VisualizationProcessor:
         if progress_callback:
             await progress_callback("generating_html", 88)
         logger.info("Generating interactive visualization with datamapplot")
-        # datamapplot can be CPU intensive too, run in executor
+        # datamapplot is CPU intensive and mostly pure Python: run it in the
+        # plot process so it does not hold this process's GIL
         plot_start = time.time()
         try:
             html_content = await loop.run_in_executor(
-                None,
+                _get_plot_pool(),
                 self._run_generate_visualization,
                 umap_vectors,
                 labels,
@@ -369,41 +613,25 @@ class VisualizationProcessor:
                 job.visualization_config,
             )
             plot_duration = time.time() - plot_start
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_plot_duration.labels(
-                        status="success"
-                    ).observe(plot_duration)
-            except Exception:
-                pass
+            _record_stage_duration("plot", "success", plot_duration)
         except Exception as e:
             plot_duration = time.time() - plot_start
-            try:
-                from .observability import get_metrics
-
-                metrics = get_metrics()
-                if metrics:
-                    metrics.visualization_plot_duration.labels(status="error").observe(
-                        plot_duration
-                    )
-            except Exception:
-                pass
+            _record_stage_duration("plot", "error", plot_duration)
+            if isinstance(e, BrokenProcessPool):
+                # The plot process died (e.g. OOM-killed); replace it for later jobs
+                shutdown_plot_pool()
             raise e
         if progress_callback:
             await progress_callback("generating_html", 100)
 
         # Prepare result
-        unique_clusters = len(set(labels[labels >= 0]))  # Exclude noise points (-1)
         result = {
             "html": html_content,
             "point_count": len(vectors),
             "cluster_count": unique_clusters,
             "stats": {
                 "unique_clusters": unique_clusters,
-                "noise_points": int(np.sum(labels == -1)),
+                "noise_points": noise_points,
                 "umap_n_neighbors": job.visualization_config.n_neighbors,
                 "hdbscan_min_cluster_size": job.visualization_config.min_cluster_size,
             },
@@ -426,13 +654,18 @@ class VisualizationProcessor:
     def _run_generate_visualization(
         self, vectors, labels, cluster_labels, texts, config
     ):
-        """Synchronous wrapper for visualization generation."""
+        """Synchronous wrapper for visualization generation.
+
+        Returns the HTML already UTF-8 encoded: the upload needs bytes, and a
+        str would be encoded to cross the process boundary and decoded again
+        in this process only to be re-encoded for S3.
+        """
         return self._generate_visualization_sync(
             vectors, labels, cluster_labels, texts, config
-        )
+        ).encode("utf-8")
 
     async def _fetch_vectors_from_qdrant(
-        self, collection_name: str, owner: str
+        self, collection_name: str, owner: str, with_payload: bool = True
     ) -> tuple[np.ndarray, list[str], list[str]]:
         """
         Fetch vectors from a Qdrant collection, with sampling if too large.
@@ -440,6 +673,8 @@ class VisualizationProcessor:
         Args:
             collection_name: Qdrant collection name
             owner: Owner/username for audit logging
+            with_payload: Fetch payloads for hover texts; when False no
+                payloads are transferred and hover_texts is empty
 
         Returns:
             Tuple of (vectors array, point IDs, hover_texts)
@@ -452,129 +687,377 @@ class VisualizationProcessor:
             point_count = collection_info.points_count
             logger.debug(f"Collection {collection_name} has {point_count} points")
 
-            vectors = []
-            ids = []
-            texts = []
-
-            # If collection is small enough, fetch all
+            # Each batch is written straight into one preallocated float32
+            # array at its position in scroll/sample order, so the retrieved
+            # points can be freed batch by batch instead of building a list of
+            # vectors and copying it into an array at the end. points_count is
+            # approximate, so the buffers grow if more points turn up
+            capacity = min(point_count or 0, MAX_POINTS)
+            vectors_array: Optional[np.ndarray] = None
+            ids: list = [None] * capacity
+            texts: list = [None] * capacity if with_payload else []
+            filled = np.zeros(capacity, dtype=bool)
+
+            def store_batch(
+                start: int,
+                batch_ids: list[str],
+                batch_vectors: np.ndarray,
+                batch_texts: list[str],
+            ) -> None:
+                nonlocal capacity, vectors_array, filled
+                if not batch_ids:
+                    return
+                end = start + len(batch_ids)
+                if end > capacity:
+                    grow = max(end, 2 * capacity) - capacity
+                    ids.extend([None] * grow)
+                    if with_payload:
+                        texts.extend([None] * grow)
+                    filled = np.concatenate((filled, np.zeros(grow, dtype=bool)))
+                    if vectors_array is not None:
+                        vectors_array = np.concatenate(
+                            (
+                                vectors_array,
+                                np.empty(
+                                    (grow, vectors_array.shape[1]), dtype=np.float32
+                                ),
+                            )
+                        )
+                    capacity += grow
+                if vectors_array is None:
+                    vectors_array = np.empty(
+                        (capacity, batch_vectors.shape[1]), dtype=np.float32
+                    )
+                vectors_array[start:end] = batch_vectors
+                filled[start:end] = True
+                ids[start:end] = batch_ids
+                if with_payload:
+                    texts[start:end] = batch_texts
+
+            # IDs come from a lightweight scroll (no vectors or payloads) and
+            # the points from concurrent retrieve() calls sharing one limit
+            semaphore = asyncio.Semaphore(QDRANT_RETRIEVE_CONCURRENCY)
             if point_count is not None and point_count <= MAX_POINTS:
+                # Whole collection: retrieve each page of IDs as soon as the
+                # scroll returns it, overlapping the scroll with the fetch
                 logger.info(
                     f"Collection size {point_count} <= {MAX_POINTS}. Fetching all points."
                 )
-                offset = None
-                limit = 1000  # Batch size for scrolling
-                batches = 0
-                prev_offset = None
 
-                while True:
-                    points, offset = await self.qdrant.scroll(
-                        collection_name=collection_name,
-                        limit=limit,
-                        offset=offset,
-                        with_vectors=True,
-                        with_payload=True,
+                def store_page_batch(page_start: int, start: int, *batch) -> None:
+                    store_batch(page_start + start, *batch)
+
+                seen = 0
+                retrievals = []
+                try:
+                    async for page in self._scroll_id_pages(collection_name):
+                        retrievals.append(
+                            asyncio.create_task(
+                                self._retrieve_points(
+                                    collection_name,
+                                    page,
+                                    functools.partial(store_page_batch, seen),
+                                    with_payload,
+                                    semaphore,
+                                )
+                            )
+                        )
+                        seen += len(page)
+                    await asyncio.gather(*retrievals)
+                except BaseException:
+                    for retrieval in retrievals:
+                        retrieval.cancel()
+                    raise
+                id_count = seen
+            else:
+                # Sampling needs the whole ID scroll before the first fetch
+                point_ids, seen = await self._scroll_point_ids(
+                    collection_name, MAX_POINTS
+                )
+                if seen > MAX_POINTS:
+                    logger.info(
+                        f"Collection size {seen} > {MAX_POINTS}. Sampled {MAX_POINTS} random points."
+                    )
+                else:
+                    logger.info(
+                        f"Collection size {seen} <= {MAX_POINTS}. Fetching all points."
                     )
+                await self._retrieve_points(
+                    collection_name, point_ids, store_batch, with_payload, semaphore
+                )
+                id_count = len(point_ids)
+
+            if vectors_array is None:
+                vectors_array = np.empty((0, 0), dtype=np.float32)
+                ids, texts = [], []
+            if capacity > id_count:
+                # points_count overestimated the collection: drop the spare rows
+                vectors_array = vectors_array[:id_count]
+                filled = filled[:id_count]
+                del ids[id_count:]
+                if with_payload:
+                    del texts[id_count:]
+            if not filled.all():
+                # Points deleted between the ID scroll and retrieve() leave gaps
+                vectors_array = vectors_array[filled]
+                ids = [point_id for point_id in ids if point_id is not None]
+                if with_payload:
+                    texts = [text for text, ok in zip(texts, filled) if ok]
 
-                    if not points:
-                        break
+            fetch_elapsed = time.time() - fetch_start
 
-                    batches += 1
-                    for point in points:
-                        vectors.append(point.vector)
-                        ids.append(str(point.id))
-                        texts.append(self._extract_hover_text(point.payload))
+            logger.info(
+                f"Fetched {len(ids)} vectors from {collection_name} for owner {owner} "
+                f"in {fetch_elapsed:.3f}s"
+            )
+            return vectors_array, ids, texts
 
-                    if offset is None or offset == prev_offset:
-                        break
-                    prev_offset = offset
+        except Exception as e:
+            fetch_elapsed = time.time() - fetch_start
+            logger.error(
+                f"Failed to fetch vectors from Qdrant in {fetch_elapsed:.3f}s: {type(e).__name__}: {e}",
+                exc_info=True,
+            )
+            raise
 
-            else:
-                # Collection too large: Fetch all IDs first, then sample, then fetch details
-                logger.info(
-                    f"Collection size {point_count} > {MAX_POINTS}. Sampling {MAX_POINTS} random points."
-                )
+    async def _scroll_id_pages(self, collection_name: str):
+        """Yield the collection's point IDs page by page (no vectors or payloads)."""
+        offset = None
+        prev_offset = None
+
+        while True:
+            points, offset = await self.qdrant.scroll(
+                collection_name=collection_name,
+                limit=QDRANT_SCROLL_BATCH_SIZE,
+                offset=offset,
+                with_vectors=False,
+                with_payload=False,
+            )
 
-                # Fetch all IDs (lightweight)
-                all_ids = []
-                offset = None
-                limit = 5000  # Larger batch for IDs
-                prev_offset = None
+            if not points:
+                break
 
-                while True:
-                    points, offset = await self.qdrant.scroll(
-                        collection_name=collection_name,
-                        limit=limit,
-                        offset=offset,
-                        with_vectors=False,
-                        with_payload=False,
-                    )
+            yield [point.id for point in points]
 
-                    if not points:
-                        break
+            if offset is None or offset == prev_offset:
+                break
+            prev_offset = offset
 
-                    for point in points:
-                        all_ids.append(point.id)
+    async def _scroll_point_ids(
+        self, collection_name: str, max_ids: int
+    ) -> tuple[list, int]:
+        """Scroll point IDs, keeping a uniform random sample of at most max_ids.
 
-                    if offset is None or offset == prev_offset:
-                        break
-                    prev_offset = offset
+        Collections up to max_ids come back whole, in scroll order. Larger ones
+        are reservoir-sampled during the scroll, so memory stays O(max_ids)
+        however many points the collection holds.
 
-                # Sample IDs
-                if len(all_ids) > MAX_POINTS:
-                    sampled_ids = random.sample(all_ids, MAX_POINTS)
+        Returns:
+            Tuple of (point IDs, number of IDs seen)
+        """
+        reservoir = []
+        seen = 0
+        rng = random.Random(42)  # Reproducible sample for the same collection
+
+        async for page in self._scroll_id_pages(collection_name):
+            for point_id in page:
+                if seen < max_ids:
+                    reservoir.append(point_id)
                 else:
-                    sampled_ids = all_ids
+                    j = rng.randrange(seen + 1)
+                    if j < max_ids:
+                        reservoir[j] = point_id
+                seen += 1
 
-                logger.info(f"Sampled {len(sampled_ids)} IDs. Fetching vectors...")
+        return reservoir, seen
 
-                # Retrieve sampled points in batches
-                batch_size = 500
-                for i in range(0, len(sampled_ids), batch_size):
-                    batch_ids = sampled_ids[i : i + batch_size]
-                    points = await self.qdrant.retrieve(
+    async def _retrieve_points(
+        self,
+        collection_name: str,
+        point_ids: list,
+        on_batch: Callable[[int, list[str], np.ndarray, list[str]], None],
+        with_payload: bool = True,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        """Retrieve points (vectors and payloads) in concurrent batches.
+
+        on_batch(start, ids, vectors, hover_texts) is called as each batch
+        arrives, with start being the index of the batch's first ID in
+        point_ids and vectors a float32 array with one row per point.
+        hover_texts is empty when with_payload is False. Calls sharing a
+        semaphore share its limit on retrieve() calls in flight.
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(QDRANT_RETRIEVE_CONCURRENCY)
+        try:
+            grpc_points = self.qdrant.grpc_points
+        except NotImplementedError:
+            # Local (in-process) client: no gRPC stub to call
+            grpc_points = None
+
+        async def retrieve_batch(start: int):
+            batch_ids = point_ids[start : start + QDRANT_RETRIEVE_BATCH_SIZE]
+            async with semaphore:
+                if grpc_points is not None:
+                    response = await grpc_points.Get(
+                        grpc.GetPoints(
+                            collection_name=collection_name,
+                            ids=[_point_id_to_grpc(point_id) for point_id in batch_ids],
+                            with_payload=grpc.WithPayloadSelector(
+                                enable=with_payload
+                            ),
+                            with_vectors=grpc.WithVectorsSelector(enable=True),
+                        ),
+                        timeout=QDRANT_GRPC_TIMEOUT_SECS,
+                    )
+                else:
+                    records = await self.qdrant.retrieve(
                         collection_name=collection_name,
                         ids=batch_ids,
                         with_vectors=True,
-                        with_payload=True,
+                        with_payload=with_payload,
                     )
 
-                    for point in points:
-                        vectors.append(point.vector)
-                        ids.append(str(point.id))
-                        texts.append(self._extract_hover_text(point.payload))
-
-            # Convert to numpy array
-            vectors_array = np.array(vectors, dtype=np.float32)
+            if grpc_points is not None:
+                on_batch(
+                    start, *self._decode_grpc_points(response.result, with_payload)
+                )
+            elif records:
+                if any(not isinstance(record.vector, list) for record in records):
+                    raise ValueError(
+                        "Qdrant returned a point without an unnamed dense vector; "
+                        "collections with named vectors are not supported"
+                    )
+                texts = []
+                if with_payload:
+                    for record in records:
+                        payload = record.payload or {}
+                        title = payload.get("item_title", "")
+                        text = payload.get("text", "")
+                        texts.append(
+                            f"{title}\n\n{text}" if title and text else title or text
+                        )
+                on_batch(
+                    start,
+                    [str(record.id) for record in records],
+                    np.asarray([record.vector for record in records], dtype=np.float32),
+                    texts,
+                )
 
-            fetch_elapsed = time.time() - fetch_start
+        await asyncio.gather(
+            *(
+                retrieve_batch(start)
+                for start in range(0, len(point_ids), QDRANT_RETRIEVE_BATCH_SIZE)
+            )
+        )
 
-            logger.info(
-                f"Fetched {len(vectors)} vectors from {collection_name} for owner {owner} "
-                f"in {fetch_elapsed:.3f}s"
+    async def _fetch_naming_texts(
+        self,
+        collection_name: str,
+        ids: list[str],
+        labels: np.ndarray,
+        label_counts: np.ndarray,
+        coords: np.ndarray,
+        samples_per_cluster: int,
+    ) -> list[str]:
+        """Fetch hover texts only for the points topic naming may sample.
+
+        Takes each cluster's most central points, with headroom for points
+        without text, and retrieves just their item_title/text payload fields.
+        Returns a list aligned with ids that is empty everywhere else.
+        """
+        fetch_start = time.time()
+        candidates_per_cluster = 2 * max(1, min(100, samples_per_cluster))
+        order = np.argsort(labels, kind="stable")
+        offsets = np.concatenate(([0], np.cumsum(label_counts)))
+        candidates = []
+        for cluster_id in np.flatnonzero(label_counts[1:]).tolist():
+            cluster_indices = order[offsets[cluster_id + 1] : offsets[cluster_id + 2]]
+            candidates.extend(
+                _members_by_centrality(cluster_indices, coords)[
+                    :candidates_per_cluster
+                ].tolist()
             )
-            return vectors_array, ids, texts
 
-        except Exception as e:
-            fetch_elapsed = time.time() - fetch_start
-            logger.error(
-                f"Failed to fetch vectors from Qdrant in {fetch_elapsed:.3f}s: {type(e).__name__}: {e}",
-                exc_info=True,
+        texts = [""] * len(ids)
+        position = {ids[i]: i for i in candidates}
+        point_ids = [
+            int(ids[i]) if ids[i].isdigit() else ids[i] for i in candidates
+        ]
+
+        # Same limit on retrieve() calls in flight as _retrieve_points
+        semaphore = asyncio.Semaphore(QDRANT_RETRIEVE_CONCURRENCY)
+
+        async def retrieve_batch(start: int):
+            async with semaphore:
+                records = await self.qdrant.retrieve(
+                    collection_name=collection_name,
+                    ids=point_ids[start : start + QDRANT_RETRIEVE_BATCH_SIZE],
+                    with_vectors=False,
+                    with_payload=["item_title", "text"],
+                )
+            for record in records:
+                payload = record.payload or {}
+                title = payload.get("item_title", "")
+                text = payload.get("text", "")
+                texts[position[str(record.id)]] = (
+                    f"{title}\n\n{text}" if title and text else title or text
+                )
+
+        await asyncio.gather(
+            *(
+                retrieve_batch(start)
+                for start in range(0, len(point_ids), QDRANT_RETRIEVE_BATCH_SIZE)
             )
-            raise
+        )
+        logger.info(
+            f"Fetched naming texts for {len(point_ids)} of {len(ids)} points "
+            f"in {time.time() - fetch_start:.3f}s"
+        )
+        return texts
+
+    def _decode_grpc_points(
+        self, points, with_payload: bool = True
+    ) -> tuple[list[str], np.ndarray, list[str]]:
+        """Convert raw gRPC RetrievedPoints to (ids, vectors, hover_texts).
 
-    def _extract_hover_text(self, payload):
-        """Helper to extract hover text from payload."""
-        hover_text = ""
-        if payload:
-            title = payload.get("item_title", "")
-            text = payload.get("text", "")
-            if title and text:
-                hover_text = f"{title}\n\n{text}"
-            elif title:
-                hover_text = title
+        Reads the protobuf messages directly instead of going through
+        qdrant-client's conversion to REST models, which builds a pydantic
+        Record and a list of Python floats per point.
+        """
+        if not points:
+            return [], np.empty((0, 0), dtype=np.float32), []
+
+        ids = []
+        texts = []
+        # Bound once: these run per point on the fetch hot path
+        append_id = ids.append
+        append_text = texts.append
+        vectors = None
+        for i, point in enumerate(points):
+            if point.vectors.WhichOneof("vectors_options") != "vector":
+                raise ValueError(
+                    "Qdrant returned a point without an unnamed dense vector; "
+                    "collections with named vectors are not supported"
+                )
+            vector = _decode_dense_vector(point.vectors.vector)
+            if vectors is None:
+                vectors = np.empty((len(points), vector.shape[0]), dtype=np.float32)
+            vectors[i] = vector
+
+            if point.id.WhichOneof("point_id_options") == "uuid":
+                append_id(point.id.uuid)
             else:
-                hover_text = text
-        return hover_text
+                append_id(str(point.id.num))
+
+            if not with_payload:
+                continue
+            # Hover text: "title\n\ntext", or whichever of the two is present
+            payload = point.payload
+            title = payload["item_title"].string_value if "item_title" in payload else ""
+            text = payload["text"].string_value if "text" in payload else ""
+            append_text(f"{title}\n\n{text}" if title and text else title or text)
+        return ids, vectors, texts
 
     def _apply_umap_sync(
         self, vectors: np.ndarray, job: VisualizationTransformJob
@@ -583,18 +1066,95 @@ class VisualizationProcessor:
 
         umap_start = time.time()
         try:
+            if (
+                CuUMAP is not None
+                and vectors.shape[0] >= GPU_UMAP_MIN_POINTS
+                and _gpu_available()
+            ):
+                try:
+                    return self._apply_umap_gpu(vectors, job, umap_start)
+                except Exception as e:  # noqa: BLE001 - e.g. out of GPU memory
+                    logger.warning(
+                        f"GPU UMAP failed ({type(e).__name__}: {e}), falling back to CPU"
+                    )
+
+            # Reuse the kNN graph from an earlier run on the same vectors:
+            # building it is the dominant cost of a UMAP fit. On a cache miss
+            # the graph is built here with UMAP's seeding and handed to UMAP as
+            # well, so (when deterministic) cold and warm runs produce the
+            # same embedding
+            n_neighbors = job.visualization_config.n_neighbors
+            min_dist = job.visualization_config.min_dist
+            seed_kwargs = _umap_seed_kwargs()
+            precomputed_knn = (None, None, None)
+            embedding_cache_path = None
+            if UMAP_KNN_CACHE_DIR and vectors.shape[0] >= UMAP_KNN_CACHE_MIN_POINTS:
+                cache_key = _umap_cache_key(vectors, job.visualization_config.metric)
+
+                # A re-run that only changes clustering, naming or display
+                # settings reuses the finished layout and skips UMAP entirely
+                embedding_cache_path = os.path.join(
+                    UMAP_KNN_CACHE_DIR, f"{cache_key}-n{n_neighbors}-d{min_dist!r}.npz"
+                )
+                cached_embedding = _load_umap_cache(embedding_cache_path, "embedding")
+                if cached_embedding is not None:
+                    umap_elapsed = time.time() - umap_start
+                    logger.info(
+                        f"UMAP embedding loaded from cache {embedding_cache_path} "
+                        f"in {umap_elapsed:.3f}s"
+                    )
+                    return np.ascontiguousarray(cached_embedding[0], dtype=np.float32)
+
+                knn_cache_path = os.path.join(UMAP_KNN_CACHE_DIR, f"{cache_key}.npz")
+                cached_knn = _load_umap_cache(knn_cache_path, "indices", "dists")
+                if cached_knn is not None and cached_knn[0].shape[1] >= n_neighbors:
+                    logger.info(f"Using cached UMAP kNN graph from {knn_cache_path}")
+                else:
+                    knn_indices, knn_dists, _ = nearest_neighbors(
+                        vectors,
+                        max(n_neighbors, UMAP_KNN_CACHE_NEIGHBORS),
+                        job.visualization_config.metric,
+                        {},
+                        False,
+                        np.random.RandomState(seed_kwargs["random_state"]),
+                        n_jobs=seed_kwargs["n_jobs"],
+                    )
+                    _save_umap_cache(
+                        knn_cache_path, indices=knn_indices, dists=knn_dists
+                    )
+                    cached_knn = (knn_indices, knn_dists)
+                # Neighbours are sorted by distance, so the first n_neighbors
+                # columns are the n_neighbors-NN graph
+                precomputed_knn = (
+                    cached_knn[0][:, :n_neighbors],
+                    cached_knn[1][:, :n_neighbors],
+                    None,
+                )
+
             logger.debug(f"Initializing UMAP with {vectors.shape[0]} vectors")
             umap = UMAP(
-                n_neighbors=job.visualization_config.n_neighbors,
+                n_neighbors=n_neighbors,
                 n_components=2,
-                min_dist=job.visualization_config.min_dist,
+                min_dist=min_dist,
                 metric=job.visualization_config.metric,
-                random_state=42,  # For reproducibility
+                **seed_kwargs,
+                precomputed_knn=precomputed_knn,
             )
 
             logger.debug("Running UMAP fit_transform...")
-            reduced = umap.fit_transform(vectors)
-            reduced_array: np.ndarray = np.asarray(reduced, dtype=np.float32)  # type: ignore
+            with warnings.catch_warnings():
+                # No search index is cached, which only disables umap.transform()
+                warnings.filterwarnings(
+                    "ignore", message=r"precomputed_knn\[2\]", category=UserWarning
+                )
+                reduced = umap.fit_transform(vectors)
+            # C-contiguous float32 from here on: HDBSCAN and datamapplot use it
+            # as-is, without another conversion copy
+            reduced_array: np.ndarray = np.ascontiguousarray(  # type: ignore
+                reduced, dtype=np.float32
+            )
+            if embedding_cache_path is not None:
+                _save_umap_cache(embedding_cache_path, embedding=reduced_array)
 
             umap_elapsed = time.time() - umap_start
             logger.info(
@@ -610,6 +1170,27 @@ class VisualizationProcessor:
             )
             raise
 
+    def _apply_umap_gpu(
+        self, vectors: np.ndarray, job: VisualizationTransformJob, umap_start: float
+    ) -> np.ndarray:
+        """Run UMAP with cuML on the GPU (same parameters as the CPU path)."""
+        logger.debug(f"Initializing cuML UMAP with {vectors.shape[0]} vectors")
+        umap = CuUMAP(
+            n_neighbors=job.visualization_config.n_neighbors,
+            n_components=2,
+            min_dist=job.visualization_config.min_dist,
+            metric=job.visualization_config.metric,
+            random_state=42,
+        )
+        reduced = umap.fit_transform(cupy.asarray(vectors, dtype=cupy.float32))
+        reduced_array = np.ascontiguousarray(cupy.asnumpy(reduced), dtype=np.float32)
+
+        umap_elapsed = time.time() - umap_start
+        logger.info(
+            f"UMAP (GPU) complete in {umap_elapsed:.3f}s: {vectors.shape} -> {reduced_array.shape}"
+        )
+        return reduced_array
+
     def _apply_hdbscan_sync(
         self, vectors: np.ndarray, job: VisualizationTransformJob
     ) -> np.ndarray:
@@ -625,6 +1206,33 @@ class VisualizationProcessor:
         """
         hdbscan_start = time.time()
         try:
+            if vectors.ndim != 2 or vectors.shape[1] > HDBSCAN_MAX_DIMS:
+                raise ValueError(
+                    f"HDBSCAN expects reduced input with at most {HDBSCAN_MAX_DIMS} "
+                    f"dimensions, got shape {vectors.shape}"
+                )
+            # fast_hdbscan's numba kernels are compiled for contiguous float32
+            # (a no-op for UMAP output, which is already in that layout)
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+            if (
+                CuHDBSCAN is not None
+                and vectors.shape[0] >= GPU_HDBSCAN_MIN_POINTS
+                and _gpu_available()
+            ):
+                try:
+                    return self._apply_hdbscan_gpu(vectors, job, hdbscan_start)
+                except Exception as e:  # noqa: BLE001 - e.g. out of GPU memory
+                    logger.warning(
+                        f"GPU HDBSCAN failed ({type(e).__name__}: {e}), falling back to CPU"
+                    )
+
+            if HDBSCAN_NUM_THREADS > 0:
+                # Per-thread setting: applies to this executor thread only
+                numba.set_num_threads(
+                    min(HDBSCAN_NUM_THREADS, numba.config.NUMBA_NUM_THREADS)
+                )
+
             logger.debug(f"Initializing HDBSCAN with {vectors.shape[0]} vectors")
             clusterer = HDBSCAN(
                 min_cluster_size=job.visualization_config.min_cluster_size,
@@ -633,8 +1241,7 @@ class VisualizationProcessor:
 
             logger.debug("Running HDBSCAN fit_predict...")
             labels = clusterer.fit_predict(vectors)
-            unique_clusters = len(set(labels[labels >= 0]))
-            noise_count = int(np.sum(labels == -1))
+            _, unique_clusters, noise_count = _label_counts(labels)
 
             hdbscan_elapsed = time.time() - hdbscan_start
             logger.info(
@@ -651,12 +1258,34 @@ class VisualizationProcessor:
             )
             raise
 
+    def _apply_hdbscan_gpu(
+        self, vectors: np.ndarray, job: VisualizationTransformJob, hdbscan_start: float
+    ) -> np.ndarray:
+        """Run HDBSCAN with cuML on the GPU (same parameters as the CPU path)."""
+        logger.debug(f"Initializing cuML HDBSCAN with {vectors.shape[0]} vectors")
+        clusterer = CuHDBSCAN(
+            min_cluster_size=job.visualization_config.min_cluster_size,
+            min_samples=job.visualization_config.min_samples or 5,
+            metric="euclidean",
+        )
+        labels = cupy.asnumpy(clusterer.fit_predict(cupy.asarray(vectors)))
+        _, unique_clusters, noise_count = _label_counts(labels)
+
+        hdbscan_elapsed = time.time() - hdbscan_start
+        logger.info(
+            f"HDBSCAN (GPU) complete in {hdbscan_elapsed:.3f}s: {unique_clusters} clusters, "
+            f"{noise_count} noise points"
+        )
+        return labels
+
     async def _generate_cluster_labels(
         self,
         labels: np.ndarray,
         texts: list[str],
         job: VisualizationTransformJob,
         llm_provider: Optional[LLMProvider] = None,
+        coords: Optional[np.ndarray] = None,
+        label_counts: Optional[np.ndarray] = None,
     ) -> Dict[int, str]:
         """
         Generate human-readable labels for each cluster.
@@ -671,6 +1300,10 @@ class VisualizationProcessor:
             texts: Associated text for each point
             job: Visualization job with LLM config
             llm_provider: Optional LLM provider
+            coords: Optional reduced (UMAP) coordinates; when given, the texts
+                sampled for naming are the ones nearest each cluster's centroid
+            label_counts: Optional points per label from _label_counts(labels),
+                to avoid counting again
 
         Returns:
             Dictionary mapping cluster ID to label (excludes cluster -1)
@@ -678,10 +1311,12 @@ class VisualizationProcessor:
         label_start = time.time()
         try:
             cluster_labels = {}
-            # Filter out cluster -1 (noise points) - they should not have labels
-            unique_clusters = sorted(
-                [cluster_id for cluster_id in set(labels) if cluster_id >= 0]
-            )
+            # Filter out cluster -1 (noise points) - they should not have labels.
+            # Slot 0 of label_counts is noise; tolist() yields plain ints for
+            # the dict keys
+            if label_counts is None:
+                label_counts = _label_counts(labels)[0]
+            unique_clusters = np.flatnonzero(label_counts[1:]).tolist()
             logger.debug(
                 f"Generating labels for {len(unique_clusters)} clusters (excluding noise cluster -1)"
             )
@@ -734,59 +1369,143 @@ class VisualizationProcessor:
                     1, min(100, job.visualization_config.samples_per_cluster)
                 )
 
+                # Group point indices by cluster with one stable sort (point
+                # order is kept within a cluster) rather than scanning all
+                # labels once per cluster. Labels start at -1 (noise), so
+                # cluster c occupies order[offsets[c + 1]:offsets[c + 2]]
+                order = np.argsort(labels, kind="stable")
+                offsets = np.concatenate(([0], np.cumsum(label_counts)))
+
+                # Checked once: the debug messages below are built per cluster
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+                # Get custom prompt from visualization config
+                custom_prompt = job.visualization_config.topic_naming_prompt
+                # The default template is the single-cluster form of the batch
+                # prompt, so it is batched; only a user-edited template needs
+                # one request per cluster
+                batch_naming = (
+                    not custom_prompt
+                    or custom_prompt.strip() == DEFAULT_TOPIC_NAMING_PROMPT.strip()
+                )
+
+                # LLM requests run concurrently, at most LLM_NAMING_CONCURRENCY
+                # at a time so the provider (or the shared inference GPU) is not
+                # flooded
+                llm_semaphore = asyncio.Semaphore(LLM_NAMING_CONCURRENCY)
+
+                async def name_cluster(cluster_id: int, sample_texts: list[str]) -> None:
+                    try:
+                        async with llm_semaphore:
+                            result = await llm_provider.generate_topic_name(
+                                sample_texts, job.llm_config, custom_prompt
+                            )
+                        cluster_labels[cluster_id] = result
+                        if debug_enabled:
+                            logger.debug(f"Cluster {cluster_id} -> '{result}'")
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to generate label for cluster {cluster_id}: {type(e).__name__}: {e}, "
+                            f"using numeric fallback"
+                        )
+                        cluster_labels[cluster_id] = f"Cluster {cluster_id}"
+
+                async def name_batch(
+                    batch_number: int, tasks: list[tuple[int, list[str]]]
+                ) -> None:
+                    batch_start_time = time.time()
+
+                    # With the default prompt the whole batch is named in one
+                    # request; clusters the reply leaves unnamed fall through
+                    # to per-cluster requests
+                    pending = tasks
+                    if batch_naming:
+                        try:
+                            async with llm_semaphore:
+                                names = await llm_provider.generate_topic_names_batch(
+                                    [sample_texts for _, sample_texts in tasks],
+                                    job.llm_config,
+                                )
+                            pending = []
+                            for (cluster_id, sample_texts), name in zip(tasks, names):
+                                if name is None:
+                                    pending.append((cluster_id, sample_texts))
+                                    continue
+                                cluster_labels[cluster_id] = name
+                                if debug_enabled:
+                                    logger.debug(f"Cluster {cluster_id} -> '{name}'")
+                        except Exception as e:
+                            logger.warning(
+                                f"Batch naming failed for {len(tasks)} clusters: "
+                                f"{type(e).__name__}: {e}, naming clusters individually"
+                            )
+
+                    await asyncio.gather(
+                        *(
+                            name_cluster(cluster_id, sample_texts)
+                            for cluster_id, sample_texts in pending
+                        )
+                    )
+
+                    batch_elapsed = time.time() - batch_start_time
+                    logger.info(
+                        f"Batch {batch_number} complete: {len(tasks)} clusters in {batch_elapsed:.3f}s "
+                        f"({batch_elapsed/len(tasks):.3f}s per cluster)"
+                    )
+
+                batches = []
                 for batch_start in range(0, len(unique_clusters), batch_size):
                     batch_end = min(batch_start + batch_size, len(unique_clusters))
                     batch_clusters = unique_clusters[batch_start:batch_end]
 
-                    logger.debug(
-                        f"Processing cluster batch {batch_start//batch_size + 1}: "
-                        f"clusters {batch_start+1}-{batch_end} of {len(unique_clusters)}"
-                    )
+                    if debug_enabled:
+                        logger.debug(
+                            f"Processing cluster batch {batch_start//batch_size + 1}: "
+                            f"clusters {batch_start+1}-{batch_end} of {len(unique_clusters)}"
+                        )
 
                     # Create tasks for parallel LLM requests
                     tasks = []
                     for cluster_id in batch_clusters:
-                        cluster_indices = np.where(labels == cluster_id)[0]
-                        cluster_texts = [texts[i] for i in cluster_indices if texts[i]]
-
-                        if not cluster_texts:
+                        cluster_indices = order[
+                            offsets[cluster_id + 1] : offsets[cluster_id + 2]
+                        ]
+                        if (
+                            coords is not None
+                            and len(cluster_indices) > samples_per_cluster
+                        ):
+                            # Most central members first: they represent the
+                            # cluster better than whichever points come first
+                            cluster_indices = _members_by_centrality(
+                                cluster_indices, coords
+                            )
+                        # Sample texts based on configuration: the first
+                        # non-empty texts in that order, stripped and truncated
+                        sample_texts = []
+                        for i in cluster_indices:
+                            text = texts[i].strip()
+                            if text:
+                                sample_texts.append(text[:LLM_SAMPLE_MAX_CHARS])
+                                if len(sample_texts) == samples_per_cluster:
+                                    break
+
+                        if not sample_texts:
                             # Empty cluster - use numeric label
                             cluster_labels[cluster_id] = f"Cluster {cluster_id}"
-                            logger.debug(
-                                f"Cluster {cluster_id}: no texts, using numeric label"
-                            )
+                            if debug_enabled:
+                                logger.debug(
+                                    f"Cluster {cluster_id}: no texts, using numeric label"
+                                )
                             continue
 
-                        # Sample texts based on configuration
-                        sample_texts = cluster_texts[:samples_per_cluster]
                         tasks.append((cluster_id, sample_texts))
 
-                    # Execute batch sequentially to avoid overwhelming GPU
                     if tasks:
-                        batch_start_time = time.time()
-
-                        # Get custom prompt from visualization config
-                        custom_prompt = job.visualization_config.topic_naming_prompt
-
-                        for cluster_id, sample_texts in tasks:
-                            try:
-                                result = await llm_provider.generate_topic_name(
-                                    sample_texts, job.llm_config, custom_prompt
-                                )
-                                cluster_labels[cluster_id] = result
-                                logger.debug(f"Cluster {cluster_id} -> '{result}'")
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to generate label for cluster {cluster_id}: {type(e).__name__}: {e}, "
-                                    f"using numeric fallback"
-                                )
-                                cluster_labels[cluster_id] = f"Cluster {cluster_id}"
+                        batches.append((batch_start // batch_size + 1, tasks))
 
-                        batch_elapsed = time.time() - batch_start_time
-                        logger.info(
-                            f"Batch {batch_start//batch_size + 1} complete: {len(tasks)} clusters in {batch_elapsed:.3f}s "
-                            f"({batch_elapsed/len(tasks):.3f}s per cluster)"
-                        )
+                await asyncio.gather(
+                    *(name_batch(number, tasks) for number, tasks in batches)
+                )
             else:
                 # Use simple numeric labels
                 if job.llm_config:
@@ -798,8 +1517,9 @@ class VisualizationProcessor:
                 else:
                     logger.debug("No LLM config provided, using numeric labels")
 
-                for cluster_id in unique_clusters:
-                    cluster_labels[cluster_id] = f"Cluster {cluster_id}"
+                cluster_labels = {
+                    cluster_id: f"Cluster {cluster_id}" for cluster_id in unique_clusters
+                }
 
             label_elapsed = time.time() - label_start
             logger.info(
@@ -846,14 +1566,17 @@ class VisualizationProcessor:
 
             # Create data for visualization
             logger.debug(f"Preparing label names for {len(labels)} points")
-            label_names = [
-                (
-                    config.noise_label
-                    if int(label) == -1
-                    else cluster_labels.get(int(label), f"Cluster {label}")
-                )
-                for label in labels
-            ]
+            # One name per cluster ID (shifted by one so noise, -1, is slot 0),
+            # then a single fancy-index maps every point to its name
+            max_label = int(labels.max()) if len(labels) else -1
+            label_lookup = np.array(
+                [config.noise_label]
+                + [
+                    cluster_labels.get(cluster_id, f"Cluster {cluster_id}")
+                    for cluster_id in range(max_label + 1)
+                ]
+            )
+            label_names = label_lookup[labels + 1]
 
             # Build kwargs for create_interactive_plot
             plot_kwargs = {
@@ -947,34 +1670,19 @@ class VisualizationProcessor:
 
             fig = datamapplot.create_interactive_plot(
                 vectors,
-                np.array(label_names),
+                label_names,
                 hover_text=texts if texts else None,
                 **plot_kwargs,
             )
             plot_elapsed = time.time() - plot_start
             logger.debug(f"datamapplot plot creation completed in {plot_elapsed:.3f}s")
 
-            # Convert the interactive figure to HTML string using temporary file
+            # Take the HTML string straight from the interactive figure:
+            # InteractiveFigure.__str__ returns the same string save() writes,
+            # so there is no need for a temp file write/read round trip
             html_start = time.time()
             logger.debug("Converting figure to HTML...")
-
-            # Create a temporary file to save the HTML
-            with tempfile.NamedTemporaryFile(
-                mode="w+", suffix=".html", delete=False, encoding="utf-8"
-            ) as tmp_file:
-                tmp_path = tmp_file.name
-
-            try:
-                # Save the figure to the temporary file
-                fig.save(tmp_path)
-
-                # Read the HTML content
-                with open(tmp_path, "r", encoding="utf-8") as f:
-                    html_content = f.read()
-            finally:
-                # Clean up the temporary file
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            html_content = str(fig)
 
             html_elapsed = time.time() - html_start
 
@@ -1013,6 +1721,11 @@ class VisualizationProcessor:
             raise
 
 
+# Processors (and so their Qdrant gRPC channels) are kept per Qdrant connection
+# config (URL and API key) and reused across jobs
+_processors: Dict[QdrantConnectionConfig, VisualizationProcessor] = {}
+
+
 async def process_visualization_job(
     job: VisualizationTransformJob,
     llm_provider: Optional[LLMProvider] = None,
@@ -1031,5 +1744,18 @@ async def process_visualization_job(
     Returns:
         Result dictionary with html, point_count, cluster_count, stats
     """
-    processor = VisualizationProcessor(job.qdrant_config.url)
+    processor = _processors.get(job.qdrant_config)
+    if processor is None:
+        processor = VisualizationProcessor(
+            job.qdrant_config.url, job.qdrant_config.api_key
+        )
+        _processors[job.qdrant_config] = processor
     return await processor.process_job(job, llm_provider, progress_callback)
+
+
+async def close_processors() -> None:
+    """Close the Qdrant clients of all cached processors."""
+    processors = list(_processors.values())
+    _processors.clear()
+    for processor in processors:
+        await processor.qdrant.close()
@@ -4,23 +4,74 @@ S3 Storage Module
 Handles uploading visualization results to S3 with owner/transform/timestamp tracking.
 """
 
+import asyncio
+import gzip
+import io
 import logging
 import os
+import re
 import time
-from datetime import datetime, timezone
+from typing import Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Multipart settings for visualization uploads: inline datamapplot bundles can
+# be tens of MB, so large files go up as parallel 8 MiB parts
+S3_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+S3_UPLOAD_MAX_CONCURRENCY = int(os.getenv("S3_UPLOAD_MAX_CONCURRENCY", "4"))
+
+# Pooled HTTP connections kept by the S3 client. botocore's default of 10 is
+# below concurrent jobs x S3_UPLOAD_MAX_CONCURRENCY parts, and requests beyond
+# the pool open (and then discard) a fresh TLS connection each
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "64"))
+
+# S3 request timeouts in seconds and total attempts per request. Retries use
+# botocore's "standard" mode: capped exponential backoff that also retries
+# throttling and transient 5xx errors
+S3_CONNECT_TIMEOUT = float(os.getenv("S3_CONNECT_TIMEOUT", "2"))
+S3_READ_TIMEOUT = float(os.getenv("S3_READ_TIMEOUT", "10"))
+S3_MAX_ATTEMPTS = int(os.getenv("S3_MAX_ATTEMPTS", "4"))
+
+# Presigned URLs are reused until this many seconds before they expire, so a
+# client always gets at least that long to start the download
+PRESIGNED_URL_REUSE_MARGIN_SECS = 60
+PRESIGNED_URL_CACHE_MAX_ENTRIES = 1024
+
+# S3 DeleteObjects accepts at most this many keys per request
+S3_DELETE_BATCH_SIZE = 1000
+
+# Store visualization HTML gzip-compressed with Content-Encoding: gzip. Off by
+# default: the API download endpoint passes the stored bytes through without
+# that header, so enable it only where clients fetch objects from S3 directly
+S3_GZIP_HTML = os.getenv("S3_GZIP_HTML", "false").lower() == "true"
+# 1 compresses about three times faster than the default 6 for a ~20% larger
+# object, for CPU-constrained workers
+S3_GZIP_LEVEL = int(os.getenv("S3_GZIP_LEVEL", "6"))
+
+
+# Visualization filenames as written by upload_visualization
+# (visualization-<timestamp>.html); anything else, such as a key containing "/"
+# or "..", could address objects outside the transform's prefix
+_VISUALIZATION_FILENAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.:-]*\.html")
+
+
+def _visualization_key(transform_id: int, filename: str) -> str:
+    """Full S3 key of a visualization file of a transform."""
+    if _VISUALIZATION_FILENAME_RE.fullmatch(filename) is None or ".." in filename:
+        raise ValueError(f"Invalid visualization filename: {filename!r}")
+    return f"visualizations/{transform_id}/{filename}"
+
 
 class S3Storage:
     """S3 storage client for visualization results."""
 
     def __init__(self):
         """Initialize S3 client with configuration from environment."""
-        init_start = time.time()
+        init_start = time.perf_counter()
         logger.debug("Initializing S3 storage client")
         self.endpoint_url = os.getenv("AWS_ENDPOINT_URL")
         self.bucket_name = os.getenv("S3_BUCKET_NAME")
@@ -30,11 +81,23 @@ class S3Storage:
         # Configure boto3
         config = Config(
             signature_version="s3v4",
-            retries={"max_attempts": 3, "mode": "adaptive"},
-            connect_timeout=5,
-            read_timeout=30,
+            retries={"total_max_attempts": S3_MAX_ATTEMPTS, "mode": "standard"},
+            connect_timeout=S3_CONNECT_TIMEOUT,
+            read_timeout=S3_READ_TIMEOUT,
+            # Detect dead pooled connections instead of hanging on them
+            tcp_keepalive=True,
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+        )
+
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=S3_MULTIPART_CHUNK_SIZE,
+            max_concurrency=S3_UPLOAD_MAX_CONCURRENCY,
         )
 
+        # (key, expires_in) -> (url, monotonic time until which it is reused)
+        self._presigned_urls: dict[tuple[str, int], tuple[str, float]] = {}
+
         # Create S3 client
         try:
             self.s3_client = boto3.client(
@@ -43,25 +106,44 @@ class S3Storage:
                 config=config,
                 region_name=os.getenv("AWS_REGION", "us-east-1"),
             )
-            init_elapsed = time.time() - init_start
+            init_elapsed = time.perf_counter() - init_start
             logger.info(
                 f"Initialized S3 client in {init_elapsed:.3f}s "
                 f"(endpoint: {self.endpoint_url or 'default AWS'}, bucket: {self.bucket_name})"
             )
         except Exception as e:
-            init_elapsed = time.time() - init_start
+            init_elapsed = time.perf_counter() - init_start
             logger.error(
                 f"Failed to initialize S3 client in {init_elapsed:.3f}s: {type(e).__name__}: {e}",
                 exc_info=True,
             )
             raise
 
+    async def warm_up(self) -> None:
+        """Open a connection to the bucket ahead of the first upload.
+
+        Resolves DNS, completes the TLS handshake and checks credentials so the
+        first job does not pay for it. Failures are logged, not raised; the
+        upload path reports real errors.
+        """
+        warm_start = time.perf_counter()
+        try:
+            await asyncio.to_thread(self.s3_client.head_bucket, Bucket=self.bucket_name)
+            warm_elapsed = time.perf_counter() - warm_start
+            logger.info(f"S3 bucket {self.bucket_name} reachable in {warm_elapsed:.3f}s")
+        except Exception as e:
+            warm_elapsed = time.perf_counter() - warm_start
+            logger.warning(
+                f"S3 warm-up for bucket {self.bucket_name} failed in {warm_elapsed:.3f}s: "
+                f"{type(e).__name__}: {e}"
+            )
+
     async def upload_visualization(
         self,
         owner: str,
         transform_id: int,
         visualization_id: int,
-        html_content: str,
+        html_content: Union[str, bytes],
     ) -> str:
         """
         Upload visualization HTML to S3 using single-bucket architecture.
@@ -70,7 +152,7 @@ class S3Storage:
             owner: Owner/username
             transform_id: Visualization transform ID
             visualization_id: Visualization ID (for audit trail)
-            html_content: HTML content to upload
+            html_content: HTML content to upload (str, or already UTF-8 encoded bytes)
 
         Returns:
             S3 key where content was stored (relative to the collection prefix)
@@ -78,7 +160,7 @@ class S3Storage:
         Raises:
             Exception: If upload fails
         """
-        upload_start = time.time()
+        upload_start = time.perf_counter()
         try:
             logger.debug(
                 f"Starting S3 upload for transform {transform_id}, visualization {visualization_id}"
@@ -86,40 +168,81 @@ class S3Storage:
 
             # Generate S3 path using single-bucket architecture
             # Pattern: visualizations/{transform_id}/{filename}
-            timestamp_str = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-            filename = f"visualization-{timestamp_str}.html"
-            s3_key = f"visualizations/{transform_id}/{filename}"
-            content_size = len(html_content.encode("utf-8"))
-
-            # Upload to S3
-            logger.debug(
-                f"Uploading to s3://{self.bucket_name}/{s3_key} ({content_size} bytes)"
+            # One clock read for both the metadata timestamp and the filename;
+            # the filename carries the sub-second part so two uploads for the
+            # same transform in the same second do not overwrite each other
+            now_ns = time.time_ns()
+            seconds, fraction_ns = divmod(now_ns, 1_000_000_000)
+            timestamp_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+            filename = f"visualization-{timestamp_str[:-1]}.{fraction_ns:09d}Z.html"
+            s3_key = _visualization_key(transform_id, filename)
+            body = (
+                html_content.encode("utf-8")
+                if isinstance(html_content, str)
+                else html_content
             )
-            put_start = time.time()
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=html_content.encode("utf-8"),
-                ContentType="text/html; charset=utf-8",
-                Metadata={
+            content_size = len(body)
+            extra_args = {
+                "ContentType": "text/html; charset=utf-8",
+                "Metadata": {
                     "owner": owner,
                     "transform-id": str(transform_id),
                     "visualization-id": str(visualization_id),
                     "timestamp": timestamp_str,
                 },
+            }
+            if S3_GZIP_HTML:
+                # The inline JS and JSON point data compress several-fold
+                gzip_start = time.perf_counter()
+                body = await asyncio.to_thread(
+                    gzip.compress, body, compresslevel=S3_GZIP_LEVEL, mtime=0
+                )
+                extra_args["ContentEncoding"] = "gzip"
+                logger.debug(
+                    f"Gzipped {content_size} bytes to {len(body)} in "
+                    f"{time.perf_counter() - gzip_start:.3f}s"
+                )
+
+            # Upload to S3
+            logger.debug(
+                f"Uploading to s3://{self.bucket_name}/{s3_key} ({len(body)} bytes)"
             )
-            put_elapsed = time.time() - put_start
-            upload_elapsed = time.time() - upload_start
+            # boto3 calls block, so they run in a thread to keep the event
+            # loop free
+            put_start = time.perf_counter()
+            if len(body) < S3_MULTIPART_CHUNK_SIZE:
+                # Small enough for one PUT: skip the managed transfer, which
+                # sets up a transfer manager and thread pool on every call
+                await asyncio.to_thread(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=body,
+                    **extra_args,
+                )
+            else:
+                # Multipart, with parts uploaded in parallel
+                await asyncio.to_thread(
+                    self.s3_client.upload_fileobj,
+                    io.BytesIO(body),
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs=extra_args,
+                    Config=self.transfer_config,
+                )
+            put_elapsed = time.perf_counter() - put_start
+            upload_elapsed = time.perf_counter() - upload_start
 
             logger.info(
                 f"Successfully uploaded to s3://{self.bucket_name}/{s3_key} in {upload_elapsed:.3f}s "
-                f"(size: {content_size} bytes, put: {put_elapsed:.3f}s)"
+                f"(size: {content_size} bytes, stored: {len(body)} bytes, "
+                f"put: {put_elapsed:.3f}s)"
             )
             # Return the full S3 key - the Rust API expects the complete path
             return s3_key
 
         except Exception as e:
-            upload_elapsed = time.time() - upload_start
+            upload_elapsed = time.perf_counter() - upload_start
             logger.error(
                 f"Failed to upload visualization to S3 in {upload_elapsed:.3f}s: "
                 f"{type(e).__name__}: {e}",
@@ -145,16 +268,25 @@ class S3Storage:
         Raises:
             Exception: If URL generation fails
         """
-        url_start = time.time()
+        url_start = time.perf_counter()
         try:
             # Construct full S3 key using single-bucket architecture
-            full_s3_key = f"visualizations/{transform_id}/{s3_key}"
+            full_s3_key = _visualization_key(transform_id, s3_key)
             logger.debug(
                 f"Generating presigned URL for {self.bucket_name}/{full_s3_key}"
             )
 
+            # A URL signed earlier for the same object and lifetime stays
+            # valid, so reuse it instead of signing again
+            cache_key = (full_s3_key, expires_in)
+            now = time.monotonic()
+            cached = self._presigned_urls.get(cache_key)
+            if cached is not None and now < cached[1]:
+                logger.debug(f"Reusing presigned URL for {self.bucket_name}/{full_s3_key}")
+                return cached[0]
+
             # Generate presigned URL
-            url_gen_start = time.time()
+            url_gen_start = time.perf_counter()
             url = self.s3_client.generate_presigned_url(
                 "get_object",
                 Params={
@@ -163,8 +295,20 @@ class S3Storage:
                 },
                 ExpiresIn=expires_in,
             )
-            url_gen_elapsed = time.time() - url_gen_start
-            url_elapsed = time.time() - url_start
+            url_gen_elapsed = time.perf_counter() - url_gen_start
+
+            if len(self._presigned_urls) >= PRESIGNED_URL_CACHE_MAX_ENTRIES:
+                self._presigned_urls = {
+                    key: entry
+                    for key, entry in self._presigned_urls.items()
+                    if now < entry[1]
+                }
+                if len(self._presigned_urls) >= PRESIGNED_URL_CACHE_MAX_ENTRIES:
+                    self._presigned_urls.clear()
+            reuse_secs = expires_in - PRESIGNED_URL_REUSE_MARGIN_SECS
+            if reuse_secs > 0:
+                self._presigned_urls[cache_key] = (url, now + reuse_secs)
+            url_elapsed = time.perf_counter() - url_start
 
             logger.info(
                 f"Generated presigned URL for s3://{self.bucket_name}/{full_s3_key} in {url_elapsed:.3f}s "
@@ -173,7 +317,7 @@ class S3Storage:
             return url
 
         except Exception as e:
-            url_elapsed = time.time() - url_start
+            url_elapsed = time.perf_counter() - url_start
             logger.error(
                 f"Failed to generate presigned URL in {url_elapsed:.3f}s: {type(e).__name__}: {e}",
                 exc_info=True,
@@ -194,23 +338,24 @@ class S3Storage:
         Raises:
             Exception: If deletion fails
         """
-        delete_start = time.time()
+        delete_start = time.perf_counter()
         try:
             # Construct full S3 key using single-bucket architecture
-            full_s3_key = f"visualizations/{transform_id}/{s3_key}"
+            full_s3_key = _visualization_key(transform_id, s3_key)
             logger.debug(f"Starting deletion of s3://{self.bucket_name}/{full_s3_key}")
 
             logger.debug(
                 f"Deleting s3://{self.bucket_name}/{full_s3_key} (owner: {owner}, transform: {transform_id})"
             )
 
-            del_start = time.time()
-            self.s3_client.delete_object(
+            del_start = time.perf_counter()
+            await asyncio.to_thread(
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=full_s3_key,
             )
-            del_elapsed = time.time() - del_start
-            delete_elapsed = time.time() - delete_start
+            del_elapsed = time.perf_counter() - del_start
+            delete_elapsed = time.perf_counter() - delete_start
 
             logger.info(
                 f"Successfully deleted s3://{self.bucket_name}/{full_s3_key} in {delete_elapsed:.3f}s "
@@ -218,10 +363,141 @@ class S3Storage:
             )
 
         except Exception as e:
-            delete_elapsed = time.time() - delete_start
+            delete_elapsed = time.perf_counter() - delete_start
             logger.error(
                 f"Failed to delete visualization from S3 in {delete_elapsed:.3f}s: "
                 f"{type(e).__name__}: {e}",
                 exc_info=True,
             )
             raise
+
+    async def _delete_keys(self, full_s3_keys: list[str]) -> int:
+        """Delete objects with DeleteObjects, 1000 keys per request.
+
+        Returns:
+            Number of DeleteObjects requests made
+
+        Raises:
+            RuntimeError: If S3 reports keys it could not delete
+        """
+        batches = [
+            full_s3_keys[start : start + S3_DELETE_BATCH_SIZE]
+            for start in range(0, len(full_s3_keys), S3_DELETE_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket_name,
+                    # Quiet: only failures are reported back
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+                for batch in batches
+            )
+        )
+        errors = [
+            error for response in responses for error in response.get("Errors", [])
+        ]
+        if errors:
+            raise RuntimeError(
+                f"Failed to delete {len(errors)} of {len(full_s3_keys)} objects, "
+                f"first: {errors[0].get('Key')} ({errors[0].get('Code')}: "
+                f"{errors[0].get('Message')})"
+            )
+        return len(responses)
+
+    async def delete_visualizations(
+        self, owner: str, transform_id: int, s3_keys: list[str]
+    ) -> None:
+        """
+        Delete several visualizations of a transform from S3.
+
+        Uses DeleteObjects, one request per 1000 keys, instead of one
+        DeleteObject request per key.
+
+        Args:
+            owner: Owner/username (for validation)
+            transform_id: Visualization transform ID (for validation)
+            s3_keys: S3 keys to delete (just the filenames)
+
+        Raises:
+            Exception: If a request fails or S3 reports keys it could not delete
+        """
+        delete_start = time.perf_counter()
+        try:
+            # Construct full S3 keys using single-bucket architecture
+            full_s3_keys = [_visualization_key(transform_id, key) for key in s3_keys]
+            logger.debug(
+                f"Deleting {len(full_s3_keys)} visualizations from s3://{self.bucket_name}/"
+                f"visualizations/{transform_id}/ (owner: {owner})"
+            )
+
+            requests = await self._delete_keys(full_s3_keys)
+
+            delete_elapsed = time.perf_counter() - delete_start
+            logger.info(
+                f"Successfully deleted {len(full_s3_keys)} visualizations of transform "
+                f"{transform_id} in {delete_elapsed:.3f}s ({requests} requests)"
+            )
+
+        except Exception as e:
+            delete_elapsed = time.perf_counter() - delete_start
+            logger.error(
+                f"Failed to delete visualizations from S3 in {delete_elapsed:.3f}s: "
+                f"{type(e).__name__}: {e}",
+                exc_info=True,
+            )
+            raise
+
+    async def delete_transform_visualizations(self, owner: str, transform_id: int) -> int:
+        """
+        Delete every visualization stored under a transform's key prefix.
+
+        All transforms share one bucket, so a transform's files are found by
+        listing its visualizations/{transform_id}/ prefix rather than by
+        dropping a bucket.
+
+        Args:
+            owner: Owner/username (for logging)
+            transform_id: Visualization transform ID
+
+        Returns:
+            Number of objects deleted
+
+        Raises:
+            Exception: If listing or deletion fails
+        """
+        delete_start = time.perf_counter()
+        prefix = f"visualizations/{transform_id}/"
+        try:
+            logger.debug(
+                f"Listing s3://{self.bucket_name}/{prefix} for deletion (owner: {owner})"
+            )
+
+            def list_keys() -> list[str]:
+                paginator = self.s3_client.get_paginator("list_objects_v2")
+                return [
+                    obj["Key"]
+                    for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+                    for obj in page.get("Contents", [])
+                ]
+
+            full_s3_keys = await asyncio.to_thread(list_keys)
+            requests = await self._delete_keys(full_s3_keys)
+
+            delete_elapsed = time.perf_counter() - delete_start
+            logger.info(
+                f"Successfully deleted {len(full_s3_keys)} objects under "
+                f"s3://{self.bucket_name}/{prefix} in {delete_elapsed:.3f}s "
+                f"({requests} delete requests)"
+            )
+            return len(full_s3_keys)
+
+        except Exception as e:
+            delete_elapsed = time.perf_counter() - delete_start
+            logger.error(
+                f"Failed to delete visualizations under {prefix} from S3 in "
+                f"{delete_elapsed:.3f}s: {type(e).__name__}: {e}",
+                exc_info=True,
+            )
+            raise
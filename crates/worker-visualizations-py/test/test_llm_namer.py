@@ -0,0 +1,39 @@
+"""Tests for parsing batched LLM topic naming replies."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from llm_namer import _parse_batch_topic_names
+
+
+def test_parses_fenced_json():
+    reply = 'Here you go:\n```json\n{"1": "Space Travel", "2": " Cooking "}\n```'
+    assert _parse_batch_topic_names(reply, 2) == ["Space Travel", "Cooking"]
+
+
+def test_missing_and_blank_keys_are_none():
+    reply = '{"1": "Finance", "3": "   "}'
+    assert _parse_batch_topic_names(reply, 4) == ["Finance", None, None, None]
+
+
+def test_non_string_values_are_none():
+    reply = '{"1": 42, "2": ["a"], "3": null, "4": {"name": "x"}, "5": "Sports"}'
+    assert _parse_batch_topic_names(reply, 5) == [None, None, None, None, "Sports"]
+
+
+def test_extra_keys_are_ignored():
+    assert _parse_batch_topic_names('{"1": "A", "2": "B", "9": "C"}', 1) == ["A"]
+
+
+def test_reply_without_json_object_raises():
+    with pytest.raises(ValueError):
+        _parse_batch_topic_names("Space Travel", 1)
+
+
+def test_json_array_raises():
+    with pytest.raises(ValueError):
+        _parse_batch_topic_names('["A", "B"]', 2)
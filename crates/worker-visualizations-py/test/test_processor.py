@@ -0,0 +1,38 @@
+"""Tests for cluster label statistics."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processor import _label_counts
+
+
+def test_counts_clusters_and_noise():
+    labels = np.array([-1, 0, 0, 2, -1, 2, 2, 1])
+    label_counts, cluster_count, noise_count = _label_counts(labels)
+    assert label_counts.tolist() == [2, 2, 1, 3]
+    assert cluster_count == 3
+    assert noise_count == 2
+
+
+def test_all_noise():
+    label_counts, cluster_count, noise_count = _label_counts(np.array([-1, -1, -1]))
+    assert label_counts.tolist() == [3]
+    assert (cluster_count, noise_count) == (0, 3)
+
+
+def test_no_points():
+    label_counts, cluster_count, noise_count = _label_counts(
+        np.array([], dtype=np.int64)
+    )
+    assert label_counts.tolist() == [0]
+    assert (cluster_count, noise_count) == (0, 0)
+
+
+def test_skipped_labels_are_not_counted_as_clusters():
+    label_counts, cluster_count, noise_count = _label_counts(np.array([0, 3, 3]))
+    assert label_counts.tolist() == [0, 1, 0, 0, 2]
+    assert (cluster_count, noise_count) == (2, 0)
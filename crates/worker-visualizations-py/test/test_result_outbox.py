@@ -0,0 +1,87 @@
+"""Tests for result publish retries and the unpublished-result outbox."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import main
+
+
+class FakeNats:
+    """Records publishes; the first `failures` flushes raise."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.published = []
+        self.flushes = 0
+
+    async def publish(self, subject, payload):
+        self.published.append((subject, payload))
+
+    async def flush(self):
+        self.flushes += 1
+        if self.flushes <= self.failures:
+            raise ConnectionError("flush failed")
+
+
+class FakeMsg:
+    def __init__(self, fail_nak: bool = False):
+        self.fail_nak = fail_nak
+        self.naks = 0
+
+    async def nak(self):
+        self.naks += 1
+        if self.fail_nak:
+            raise ConnectionError("nak failed")
+
+
+@pytest.fixture(autouse=True)
+def fast_outbox(monkeypatch):
+    monkeypatch.setattr(main, "RESULT_PUBLISH_RETRY_BACKOFF_SECS", 0)
+    monkeypatch.setattr(main, "RESULT_OUTBOX_MAX_SIZE", 2)
+    main._result_outbox.clear()
+    yield
+    main._result_outbox.clear()
+
+
+def test_publish_succeeds_after_transient_flush_failure():
+    nc = FakeNats(failures=main.RESULT_PUBLISH_RETRY_ATTEMPTS - 1)
+    items = [("subject.a", b"1", None), ("subject.b", b"2", None)]
+    assert asyncio.run(main._publish_with_retry(nc, items))
+    assert nc.flushes == main.RESULT_PUBLISH_RETRY_ATTEMPTS
+    assert nc.published[-2:] == [("subject.a", b"1"), ("subject.b", b"2")]
+
+
+def test_publish_gives_up_after_retry_attempts():
+    nc = FakeNats(failures=main.RESULT_PUBLISH_RETRY_ATTEMPTS)
+    assert not asyncio.run(main._publish_with_retry(nc, [("subject", b"1", None)]))
+    assert nc.flushes == main.RESULT_PUBLISH_RETRY_ATTEMPTS
+
+
+def test_progress_updates_are_not_parked():
+    asyncio.run(main._park_result(("subject", b"progress", None)))
+    assert not main._result_outbox
+
+
+def test_results_are_parked_until_outbox_is_full():
+    parked = [("subject", b"1", FakeMsg()), ("subject", b"2", FakeMsg())]
+    overflow = ("subject", b"3", FakeMsg())
+    for item in parked + [overflow]:
+        asyncio.run(main._park_result(item))
+    assert list(main._result_outbox) == parked
+    assert [item[2].naks for item in parked] == [0, 0]
+    assert overflow[2].naks == 1
+
+
+def test_failed_nak_of_overflowing_result_is_swallowed():
+    main._result_outbox.extend(
+        [("subject", b"1", FakeMsg()), ("subject", b"2", FakeMsg())]
+    )
+    msg = FakeMsg(fail_nak=True)
+    asyncio.run(main._park_result(("subject", b"3", msg)))
+    assert msg.naks == 1
+    assert len(main._result_outbox) == 2
@@ -0,0 +1,35 @@
+"""Tests for visualization S3 key validation."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from storage import _VISUALIZATION_FILENAME_RE, _visualization_key
+
+
+def test_uploaded_filename_maps_to_transform_key():
+    filename = "visualization-2026-10-16T12:34:56.123456789Z.html"
+    assert _VISUALIZATION_FILENAME_RE.fullmatch(filename)
+    assert _visualization_key(42, filename) == f"visualizations/42/{filename}"
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "",
+        ".html",
+        "visualization.txt",
+        "visualization.html.gz",
+        "../other/visualization.html",
+        "nested/visualization.html",
+        "visualization..html",
+        "-visualization.html",
+        "visualization .html",
+    ],
+)
+def test_rejects_invalid_filenames(filename):
+    with pytest.raises(ValueError):
+        _visualization_key(42, filename)